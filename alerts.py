@@ -0,0 +1,248 @@
+import argparse
+import logging
+import sqlite3
+import time
+import numpy as np
+import ingest
+import screener
+
+"""
+Alert Rule Engine - price crossings and volume spikes per ingested minute
+Rules live in each profile DB (alert_rules) and are compiled once per run:
+crossing thresholds become one array sorted by (symbol, threshold), so a
+new bar only binary-searches its own symbol's thresholds between the
+previous and current close - the rules in that gap are the ones that
+fired. Volume-ratio rules are plain arrays compared for all symbols at
+once. Fired alerts go to the alerts table, one row per (rule, bar).
+
+Rule kinds:
+    cross_above   close moves from below X to X or above
+    cross_below   close moves from above X to X or below
+    volume_ratio  volume / trailing 20-bar average reaches X (edge-triggered)
+
+Usage:
+    python alerts.py --db nifty50_top20.db --add RELIANCE.NS cross_above 3000
+    python alerts.py --db nifty50_top20.db --recent 20
+"""
+
+PRICE_KINDS = ('cross_above', 'cross_below')
+RATIO_KINDS = ('volume_ratio',)
+KEY = np.dtype([('symbol', '<i8'), ('threshold', '<f8')])
+CURSOR = 'alerts_last_bar'   # db_meta key: last bar already evaluated
+
+def create_tables(conn):
+    conn.execute(f'''
+        CREATE TABLE IF NOT EXISTS alert_rules (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            symbol TEXT NOT NULL,
+            kind TEXT NOT NULL CHECK (kind IN ({', '.join(repr(k) for k in PRICE_KINDS + RATIO_KINDS)})),
+            threshold REAL NOT NULL,
+            active INTEGER NOT NULL DEFAULT 1,
+            created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS alerts (
+            rule_id INTEGER NOT NULL,
+            datetime DATETIME NOT NULL,
+            symbol TEXT NOT NULL,
+            kind TEXT NOT NULL,
+            threshold REAL,
+            value REAL,
+            fired_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+            PRIMARY KEY (rule_id, datetime)
+        )
+    ''')
+    conn.execute('CREATE TABLE IF NOT EXISTS db_meta (key TEXT PRIMARY KEY, value TEXT)')
+
+def _ranges(lo, hi):
+    """(query number, position) for every position in [lo[i], hi[i])"""
+    lengths = np.maximum(hi - lo, 0)
+    total = int(lengths.sum())
+    if not total:
+        return np.empty(0, dtype='int64'), np.empty(0, dtype='int64')
+    queries = np.repeat(np.arange(len(lo)), lengths)
+    offsets = np.cumsum(lengths) - lengths
+    return queries, np.repeat(lo - offsets, lengths) + np.arange(total)
+
+def _keys(symbols, values):
+    keys = np.empty(len(symbols), dtype=KEY)
+    keys['symbol'] = symbols
+    keys['threshold'] = values
+    return keys
+
+class RuleBook:
+    """Active rules compiled into sorted per-symbol threshold arrays"""
+
+    def __init__(self, rules):
+        rules = list(rules)   # (rule_id, symbol, kind, threshold)
+        self.size = len(rules)
+        self.symbols = sorted({rule[1] for rule in rules})
+        self.ids = {symbol: i for i, symbol in enumerate(self.symbols)}
+
+        self.keys, self.rule_ids = {}, {}
+        for kind in PRICE_KINDS + RATIO_KINDS:
+            picked = [rule for rule in rules if rule[2] == kind]
+            symbol_ids = np.array([self.ids[rule[1]] for rule in picked], dtype='int64')
+            thresholds = np.array([rule[3] for rule in picked], dtype='float64')
+            ids = np.array([rule[0] for rule in picked], dtype='int64')
+            order = np.lexsort((thresholds, symbol_ids))
+            self.keys[kind] = _keys(symbol_ids[order], thresholds[order])
+            self.rule_ids[kind] = ids[order]
+
+    def _crossings(self, kind, symbol_ids, previous, current):
+        """Rules of `kind` whose threshold lies between previous and current close"""
+        keys = self.keys[kind]
+        if kind == 'cross_above':    # previous < X <= current
+            lo = np.searchsorted(keys, _keys(symbol_ids, previous), side='right')
+            hi = np.searchsorted(keys, _keys(symbol_ids, current), side='right')
+        else:                        # current <= X < previous
+            lo = np.searchsorted(keys, _keys(symbol_ids, current), side='left')
+            hi = np.searchsorted(keys, _keys(symbol_ids, previous), side='left')
+        return _ranges(lo, hi)
+
+    def evaluate(self, panel, since=None):
+        """Fired rules for the panel's bars after `since` (last bar only if None)
+        -> [(rule_id, datetime, symbol, kind, threshold, value)]"""
+        index, symbols, values = panel
+        columns = np.array([self.ids.get(s, -1) for s in symbols], dtype='int64')
+        known = np.flatnonzero(columns >= 0)
+        if not self.size or not len(known) or len(index) < 2:
+            return []
+        symbol_ids = columns[known]
+        names = np.asarray(symbols)[known]
+        stamps = np.asarray(index.strftime('%Y-%m-%d %H:%M:%S'))
+        close = values[:, known, 3]
+        volume = values[:, known, 4]
+
+        new = np.flatnonzero(stamps > since) if since else np.array([len(index) - 1])
+        new = new[new >= 1]
+        if not len(new):
+            return []
+
+        fired = []
+        # Price crossings: previous close carried over bars without a trade
+        rows = np.where(np.isnan(close), 0, np.arange(len(index))[:, None])
+        carried = close[np.maximum.accumulate(rows, axis=0), np.arange(close.shape[1])]
+        previous = ingest.snap_prices(carried[new - 1].ravel())
+        current = ingest.snap_prices(close[new].ravel())
+        bars = np.repeat(new, close.shape[1])
+        columns = np.tile(np.arange(close.shape[1]), len(new))
+        moved = ~np.isnan(previous) & ~np.isnan(current) & (previous != current)
+        for kind, direction in (('cross_above', current > previous), ('cross_below', current < previous)):
+            picked = np.flatnonzero(moved & direction)
+            queries, positions = self._crossings(kind, symbol_ids[columns[picked]], previous[picked], current[picked])
+            query_rows = picked[queries]
+            fired.extend(zip(self.rule_ids[kind][positions].tolist(), stamps[bars[query_rows]].tolist(),
+                             names[columns[query_rows]].tolist(), [kind] * len(positions),
+                             self.keys[kind]['threshold'][positions].tolist(), current[query_rows].tolist()))
+
+        # Volume ratio vs the trailing window (same definition as the screener), all rules at once
+        keys = self.keys['volume_ratio']
+        if len(keys):
+            ratio = _volume_ratio(volume)
+            position = np.full(len(self.symbols), -1)
+            position[symbol_ids] = np.arange(len(symbol_ids))
+            rule_columns = position[keys['symbol']]
+            present = np.flatnonzero(rule_columns >= 0)
+            rule_columns = rule_columns[present]
+            thresholds = keys['threshold'][present]
+            for t in new:
+                now_ratio = ratio[t, rule_columns]
+                before = np.nan_to_num(ratio[t - 1, rule_columns])
+                hit = np.flatnonzero((now_ratio >= thresholds) & ~(before >= thresholds))
+                fired.extend(zip(self.rule_ids['volume_ratio'][present[hit]].tolist(), [str(stamps[t])] * len(hit),
+                                 names[rule_columns[hit]].tolist(), ['volume_ratio'] * len(hit),
+                                 thresholds[hit].tolist(), now_ratio[hit].tolist()))
+        return fired
+
+def _volume_ratio(volume, window=screener.VOLUME_WINDOW):
+    """volume[t] / mean of the previous `window` bars (NaN-aware), per symbol"""
+    traded = ~np.isnan(volume)
+    sums = np.concatenate([np.zeros((1, volume.shape[1])), np.cumsum(np.where(traded, volume, 0), axis=0)])
+    counts = np.concatenate([np.zeros((1, volume.shape[1])), np.cumsum(traded, axis=0)])
+    upper = np.arange(len(volume))
+    lower = np.maximum(upper - window, 0)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        average = (sums[upper] - sums[lower]) / (counts[upper] - counts[lower])
+        return volume / average
+
+def load(db_path):
+    """(RuleBook, last evaluated bar) for a profile DB, or None without active rules"""
+    conn = sqlite3.connect(db_path)
+    try:
+        create_tables(conn)
+        rules = conn.execute('SELECT id, symbol, kind, threshold FROM alert_rules WHERE active = 1').fetchall()
+        row = conn.execute('SELECT value FROM db_meta WHERE key = ?', (CURSOR,)).fetchone()
+        conn.commit()
+    finally:
+        conn.close()
+    if not rules:
+        return None
+    return RuleBook(rules), row[0] if row else None
+
+def store(conn, fired):
+    """Insert fired alerts, ignoring (rule, bar) pairs already stored; returns new rows - caller commits"""
+    before = conn.total_changes
+    conn.executemany('''
+        INSERT OR IGNORE INTO alerts (rule_id, datetime, symbol, kind, threshold, value)
+        VALUES (?, ?, ?, ?, ?, ?)
+    ''', fired)
+    return conn.total_changes - before
+
+def run(book, panel, db_path, since=None):
+    """Evaluate a freshly stored batch and record what fired"""
+    start_time = time.time()
+    fired = book.evaluate(panel, since)
+    if not fired:
+        return 0
+    conn = sqlite3.connect(db_path, timeout=30)
+    try:
+        stored = store(conn, fired)
+        conn.commit()
+    finally:
+        conn.close()
+    elapsed = (time.time() - start_time) * 1000
+    logging.info(f"🔔 Alerts: {stored} new ({len(fired)} fired) from {book.size:,} rules in {elapsed:.1f} ms")
+    return stored
+
+def advance(db_path, panel):
+    """Remember the last evaluated bar so the next run only looks at newer ones"""
+    if panel is None or not len(panel[0]):
+        return
+    conn = sqlite3.connect(db_path)
+    try:
+        create_tables(conn)
+        conn.execute('INSERT OR REPLACE INTO db_meta (key, value) VALUES (?, ?)',
+                     (CURSOR, panel[0][-1].strftime('%Y-%m-%d %H:%M:%S')))
+        conn.commit()
+    finally:
+        conn.close()
+
+def main():
+    parser = argparse.ArgumentParser(description='Alert rules')
+    parser.add_argument('--db', default='nifty50_top20.db')
+    parser.add_argument('--add', nargs=3, metavar=('SYMBOL', 'KIND', 'THRESHOLD'))
+    parser.add_argument('--recent', type=int, default=20)
+    args = parser.parse_args()
+
+    conn = sqlite3.connect(args.db)
+    try:
+        create_tables(conn)
+        if args.add:
+            symbol, kind, threshold = args.add
+            if kind not in PRICE_KINDS + RATIO_KINDS:
+                parser.error(f"kind must be one of {', '.join(PRICE_KINDS + RATIO_KINDS)}")
+            conn.execute('INSERT INTO alert_rules (symbol, kind, threshold) VALUES (?, ?, ?)',
+                         (symbol, kind, float(threshold)))
+            conn.commit()
+        for row in conn.execute('''
+            SELECT datetime, symbol, kind, threshold, value FROM alerts
+            ORDER BY datetime DESC, rule_id LIMIT ?
+        ''', (args.recent,)):
+            print(f"{row[0]}  {row[1]:<16} {row[2]:<12} {row[3]:>10.2f}  {row[4]:.2f}")
+    finally:
+        conn.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,217 @@
+import argparse
+import hashlib
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from datetime import datetime, date, timedelta
+import pytz
+import ingest
+
+"""
+Historical Backfill - PARALLEL WINDOWED MODE
+Plans every (interval, window, batch) request up front, runs them on a
+bounded worker pool and checkpoints each finished request, so an
+interrupted backfill resumes where it stopped. Windows sit on a fixed
+calendar grid (multiples of days-per-request from GRID_EPOCH), so the
+checkpoint keys stay the same when a backfill is resumed on a later day.
+
+Usage: python backfill.py --from 2025-06-01 --to 2025-09-30 [--workers 8]
+"""
+
+IST = pytz.timezone('Asia/Kolkata')
+
+# Yahoo only serves fine intervals for recent history.
+# (interval, max age in days, days per request) - finest first
+INTERVAL_PLAN = [
+    ('1m', 29, 7),
+    ('5m', 59, 30),
+    ('60m', 729, 90),
+    ('1d', None, 365),
+]
+
+DEFAULT_WORKERS = 8
+GRID_EPOCH = date(2000, 1, 3)   # Window boundaries are multiples of days-per-request from here
+HANDOVER_DAYS = 7               # Grid of the switch to a finer interval (<= 6 days fetched coarser)
+# yf.download keeps its results in module globals before this version, so
+# concurrent calls overwrite each other (see requirements.txt)
+PARALLEL_YFINANCE = (1, 7)
+
+def yahoo_download(symbols, start, end, interval):
+    """Fetch one window for a batch of symbols from Yahoo"""
+    import yfinance as yf
+    return yf.download(
+        tickers=symbols,
+        start=start.isoformat(),
+        end=end.isoformat(),
+        interval=interval,
+        group_by='ticker',
+        threads=False,
+        progress=False,
+        auto_adjust=True
+    )
+
+def grid_after(day, days):
+    """First grid boundary after day, for windows of `days`"""
+    return GRID_EPOCH + timedelta(days=((day - GRID_EPOCH).days // days + 1) * days)
+
+def parallel_downloads_safe():
+    """True if concurrent yf.download calls keep separate results"""
+    import yfinance as yf
+    version = tuple(int(part) for part in yf.__version__.split('.')[:2] if part.isdigit())
+    return version >= PARALLEL_YFINANCE
+
+def plan_windows(start, end, today):
+    """Split [start, end) into (interval, window_start, window_end) using the finest interval available"""
+    windows = []
+    cursor = start
+    while cursor < end:
+        age = (today - cursor).days
+        for level, (interval, max_age, window_days) in enumerate(INTERVAL_PLAN):
+            if max_age is None or age <= max_age:
+                break
+
+        window_end = min(grid_after(cursor, window_days), end)
+        # Hand over to the next finer interval on the first weekly boundary it is
+        # available from, so the split (and its keys) moves once a week, not daily
+        if level > 0:
+            finer_age = INTERVAL_PLAN[level - 1][1]
+            handover = grid_after(today - timedelta(days=finer_age + 1), HANDOVER_DAYS)
+            if cursor < handover < window_end:
+                window_end = handover
+
+        windows.append((interval, cursor, window_end))
+        cursor = window_end
+    return windows
+
+def task_key(interval, start, end, symbols):
+    """Stable id for one planned request, used as the checkpoint key"""
+    raw = f"{interval}|{start}|{end}|{','.join(symbols)}"
+    return hashlib.sha1(raw.encode()).hexdigest()
+
+def plan_tasks(symbols, start, end, batch_size, today):
+    """Plan the whole request set: every window x every symbol batch"""
+    tasks = []
+    for interval, w_start, w_end in plan_windows(start, end, today):
+        for i in range(0, len(symbols), batch_size):
+            batch = symbols[i:i + batch_size]
+            tasks.append((task_key(interval, w_start, w_end, batch), interval, w_start, w_end, batch))
+    return tasks
+
+def create_checkpoint_table(conn):
+    """Create backfill progress table"""
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS backfill_checkpoint (
+            task_key TEXT PRIMARY KEY,
+            interval TEXT NOT NULL,
+            window_start DATE NOT NULL,
+            window_end DATE NOT NULL,
+            symbols INTEGER,
+            candles INTEGER,
+            completed_at DATETIME DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+    conn.commit()
+
+def completed_tasks(conn):
+    """Checkpoint keys already written by earlier runs"""
+    return {row[0] for row in conn.execute('SELECT task_key FROM backfill_checkpoint')}
+
+def run_backfill(symbols, start, end, db_path, workers=DEFAULT_WORKERS,
+                 batch_size=100, provider=yahoo_download, today=None, price_encoding=None):
+    """Run a planned backfill; returns (requests done, candles stored)"""
+    today = today or datetime.now(IST).date()
+    if provider is yahoo_download and workers > 1 and not parallel_downloads_safe():
+        logging.warning(f"⚠️ yfinance older than {'.'.join(map(str, PARALLEL_YFINANCE))} shares download "
+                        f"state between calls - running with 1 worker")
+        workers = 1
+    ingest.create_database(db_path, price_encoding)
+    conn = ingest.connect(db_path)
+    create_checkpoint_table(conn)
+
+    tasks = plan_tasks(symbols, start, end, batch_size, today)
+    done = completed_tasks(conn)
+    pending = [task for task in tasks if task[0] not in done]
+    logging.info(f"🗓️ Backfill {start} → {end}: {len(tasks)} requests planned, {len(tasks) - len(pending)} already done")
+
+    requests_done = 0
+    total_candles = 0
+    failed = 0
+    start_time = time.time()
+
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            queue = iter(pending)
+            in_flight = {}
+
+            def submit_next():
+                task = next(queue, None)
+                if task is not None:
+                    key, interval, w_start, w_end, batch = task
+                    in_flight[pool.submit(provider, batch, w_start, w_end, interval)] = task
+
+            # Keep at most 2x workers results in memory
+            for _ in range(workers * 2):
+                submit_next()
+
+            while in_flight:
+                finished, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    key, interval, w_start, w_end, batch = in_flight.pop(future)
+                    submit_next()
+                    try:
+                        data = future.result()
+                    except Exception as e:
+                        failed += 1
+                        logging.error(f"❌ {interval} {w_start}→{w_end} ({len(batch)} stocks) failed: {str(e)}")
+                        continue
+
+                    candles = 0
+                    if data is not None and not data.empty:
+                        candles, _ = ingest.store_frame(conn, data, batch, interval)
+                    conn.execute('''
+                        INSERT OR REPLACE INTO backfill_checkpoint
+                        (task_key, interval, window_start, window_end, symbols, candles)
+                        VALUES (?, ?, ?, ?, ?, ?)
+                    ''', (key, interval, w_start.isoformat(), w_end.isoformat(), len(batch), candles))
+                    conn.commit()
+
+                    requests_done += 1
+                    total_candles += candles
+                    if requests_done % 50 == 0 or requests_done == len(pending):
+                        logging.info(f"💾 {requests_done}/{len(pending)} requests, {total_candles:,} candles")
+    finally:
+        conn.close()
+
+    elapsed = time.time() - start_time
+    logging.info(f"✅ Backfill finished in {elapsed:.2f} seconds: {requests_done} requests, "
+                 f"{total_candles:,} candles, {failed} failed (rerun to retry)")
+    return requests_done, total_candles
+
+def main():
+    """Parse arguments and run the backfill"""
+    parser = argparse.ArgumentParser(description='Backfill historical candles')
+    parser.add_argument('--from', dest='start', required=True, type=date.fromisoformat)
+    parser.add_argument('--to', dest='end', required=True, type=date.fromisoformat,
+                        help='inclusive end date')
+    parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS)
+    parser.add_argument('--batch-size', type=int, default=100)
+    parser.add_argument('--target', default='default', help='profile whose universe / DB to fill')
+    parser.add_argument('--db', default=None)
+    args = parser.parse_args()
+
+    import log_setup
+    import profiles
+    log_setup.setup_logging('backfill.log')
+    profile = profiles.PROFILES[args.target]
+    run_backfill(
+        list(dict.fromkeys(profile.universe)),
+        args.start,
+        args.end + timedelta(days=1),
+        args.db or profile.db_path,
+        workers=args.workers,
+        batch_size=args.batch_size,
+        price_encoding=profile.price_encoding
+    )
+
+if __name__ == "__main__":
+    main()
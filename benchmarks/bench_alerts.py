@@ -0,0 +1,136 @@
+import argparse
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+from datetime import date
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import alerts
+import ingest
+import screener
+from synthetic import make_frame, session_index, universe
+
+"""
+Alert engine: 100k rules x 1500 symbols, one ingested minute at a time
+Compiles the rules, evaluates each new bar of a synthetic session, checks
+the result against a brute-force per-rule scan, and compares with the
+old approach of one SQLite query per rule (timed on a sample, scaled up).
+
+Usage: python benchmarks/bench_alerts.py --symbols 1500 --rules 100000
+"""
+
+def make_rules(panel, count, seed=0):
+    """70% price crossings near each symbol's midday close, 30% volume-ratio rules"""
+    rng = np.random.default_rng(seed)
+    _, symbols, values = panel
+    midday = values[len(values) // 2, :, 3]
+    picks = rng.integers(0, len(symbols), count)
+    kinds = rng.choice(['cross_above', 'cross_below', 'volume_ratio'], count, p=[0.35, 0.35, 0.3])
+    thresholds = np.where(kinds == 'volume_ratio', np.round(rng.uniform(2, 6, count), 1),
+                          np.round(midday[picks] * rng.uniform(0.98, 1.02, count) * 20) / 20)
+    return [(i + 1, symbols[p], k, float(x)) for i, (p, k, x) in enumerate(zip(picks, kinds, thresholds))]
+
+def brute_force(rules, panel, t):
+    """Per-rule check of bar t (reference)"""
+    _, symbols, values = panel
+    column = {s: i for i, s in enumerate(symbols)}
+    ratio = alerts._volume_ratio(values[:, :, 4])
+    fired = set()
+    for rule_id, symbol, kind, x in rules:
+        j = column[symbol]
+        closes = values[:t, j, 3]
+        traded = closes[~np.isnan(closes)]
+        previous, current = (traded[-1] if len(traded) else np.nan), values[t, j, 3]
+        if kind == 'cross_above' and previous < x <= current:
+            fired.add(rule_id)
+        elif kind == 'cross_below' and current <= x < previous:
+            fired.add(rule_id)
+        elif kind == 'volume_ratio' and ratio[t, j] >= x and not np.nan_to_num(ratio[t - 1, j]) >= x:
+            fired.add(rule_id)
+    return fired
+
+def per_rule_sql(db_path, rules, sample):
+    """Old approach: one query per rule; seconds for `sample` rules"""
+    conn = sqlite3.connect(db_path)
+    start = time.perf_counter()
+    for _, symbol, kind, x in rules[:sample]:
+        if kind == 'volume_ratio':
+            conn.execute('''
+                SELECT volume, (SELECT AVG(volume) FROM (SELECT volume FROM stock_1min_data
+                                WHERE symbol = ? ORDER BY datetime DESC LIMIT 20 OFFSET 1))
+                FROM stock_1min_data WHERE symbol = ? ORDER BY datetime DESC LIMIT 1
+            ''', (symbol, symbol)).fetchall()
+        else:
+            conn.execute('SELECT close FROM stock_1min_data WHERE symbol = ? ORDER BY datetime DESC LIMIT 2',
+                         (symbol,)).fetchall()
+    elapsed = time.perf_counter() - start
+    conn.close()
+    return elapsed
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--symbols', type=int, default=1500)
+    parser.add_argument('--rules', type=int, default=100000)
+    parser.add_argument('--minutes', type=int, default=30)
+    args = parser.parse_args()
+
+    symbols = universe(args.symbols)
+    index = session_index(date(2025, 9, 1), date(2025, 9, 2))
+    frame = make_frame(symbols, index)
+    rng = np.random.default_rng(1)
+    spikes = [c for c in frame.columns if c[1] == 'Volume']
+    frame[spikes] = frame[spikes].to_numpy() * np.where(rng.random((len(index), len(spikes))) < 0.01, 8, 1)
+    panel = screener.to_panel(frame, symbols)
+    rules = make_rules(panel, args.rules)
+
+    start = time.perf_counter()
+    book = alerts.RuleBook(rules)
+    compile_ms = (time.perf_counter() - start) * 1000
+
+    conn = sqlite3.connect(':memory:')
+    alerts.create_tables(conn)
+    stamps = index.strftime('%Y-%m-%d %H:%M:%S')
+    first = len(index) // 2 - args.minutes // 2
+    timings, store_timings, fired_total, mismatches = [], [], 0, 0
+    for t in range(first, first + args.minutes):
+        # What the engine sees after store_data: the session so far, one new bar
+        sub = (index[:t + 1], panel[1], panel[2][:t + 1])
+        start = time.perf_counter()
+        fired = book.evaluate(sub, since=stamps[t - 1])
+        timings.append(time.perf_counter() - start)
+        start = time.perf_counter()
+        alerts.store(conn, fired)
+        conn.commit()
+        store_timings.append(time.perf_counter() - start)
+        fired_total += len(fired)
+        if t < first + 3:
+            mismatches += len({f[0] for f in fired} ^ brute_force(rules, panel, t))
+    again = alerts.store(conn, book.evaluate((index[:t + 1], panel[1], panel[2][:t + 1]), since=stamps[t - 1]))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, 'bench.db')
+        ingest.create_database(db_path)
+        store = ingest.connect(db_path)
+        ingest.store_frame(store, frame.iloc[:first + args.minutes], symbols)
+        store.commit()
+        store.close()
+        sample = 2000
+        sql_minute = per_rule_sql(db_path, rules, sample) * len(rules) / sample
+
+    median = sorted(timings)[len(timings) // 2] * 1000
+    print(f"{len(rules):,} rules on {args.symbols} symbols, {args.minutes} minutes")
+    print(f"  compile               {compile_ms:8.1f} ms (once per run)")
+    print(f"  evaluate / minute     {median:8.1f} ms median, {max(timings) * 1000:.1f} ms max")
+    print(f"  store / minute        {sorted(store_timings)[len(store_timings) // 2] * 1000:8.1f} ms median")
+    print(f"  fired                 {fired_total / args.minutes:8.0f} alerts / minute")
+    print(f"  brute-force mismatch  {mismatches:8d} (first 3 minutes)")
+    print(f"  re-stored duplicates  {again:8d} new rows")
+    print(f"  per-rule SQL (old)    {sql_minute * 1000:8.0f} ms / minute (from {sample} rules)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+import argparse
+import os
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import backfill
+from synthetic import make_frame, session_index, universe
+
+"""
+Backfill throughput against a local stand-in provider
+Each request sleeps --latency seconds (network) and returns a synthetic frame.
+
+Usage: python benchmarks/bench_backfill.py --symbols 1500 --days 120
+"""
+
+def stand_in_provider(latency):
+    """Build a provider with fixed per-request latency"""
+    def provider(symbols, start, end, interval):
+        time.sleep(latency)
+        return make_frame(symbols, session_index(start, end, interval), seed=len(symbols))
+    return provider
+
+def run(symbols, days, workers, latency, batch_size):
+    """One timed backfill into a fresh database"""
+    today = date.today()
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, 'bench.db')
+        started = time.time()
+        requests, candles = backfill.run_backfill(
+            symbols, today - timedelta(days=days), today, db_path,
+            workers=workers, batch_size=batch_size,
+            provider=stand_in_provider(latency), today=today
+        )
+        elapsed = time.time() - started
+
+        # Second pass must find everything checkpointed
+        resumed, _ = backfill.run_backfill(
+            symbols, today - timedelta(days=days), today, db_path,
+            workers=workers, batch_size=batch_size,
+            provider=stand_in_provider(latency), today=today
+        )
+    return requests, candles, elapsed, resumed
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--symbols', type=int, default=1500)
+    parser.add_argument('--days', type=int, default=120)
+    parser.add_argument('--latency', type=float, default=1.0)
+    parser.add_argument('--batch-size', type=int, default=100)
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 8])
+    args = parser.parse_args()
+
+    symbols = universe(args.symbols)
+    print(f"{'workers':>8} {'requests':>9} {'candles':>12} {'seconds':>9} {'candles/s':>11} {'rerun':>6}")
+    for workers in args.workers:
+        requests, candles, elapsed, resumed = run(symbols, args.days, workers, args.latency, args.batch_size)
+        print(f"{workers:>8} {requests:>9} {candles:>12,} {elapsed:>9.2f} {candles / elapsed:>11,.0f} {resumed:>6}")
+
+if __name__ == "__main__":
+    main()
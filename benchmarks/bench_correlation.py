@@ -0,0 +1,106 @@
+import argparse
+import os
+import sys
+import time
+from datetime import date
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import correlation
+from synthetic import session_index, universe
+
+"""
+Incremental rolling correlation / beta vs full pandas recomputation
+Closes follow a one-factor model (so there are real correlated pairs)
+with 5% of bars missing. Checks the tracker against DataFrame.corr() /
+cov() on the same window, then times one minute's update, the on-demand
+matrix and the top-k query per universe size.
+
+Usage: python benchmarks/bench_correlation.py --sizes 500 1500 3000
+"""
+
+def factor_panel(symbols, index, seed=0, missing=0.05):
+    """Screener-style panel of tick-rounded closes driven by a market factor + sectors"""
+    rng = np.random.default_rng(seed)
+    rows, cols = len(index), len(symbols)
+    market = rng.normal(0, 0.0006, (rows, 1))
+    sectors = rng.normal(0, 0.0005, (rows, 20))[:, rng.integers(0, 20, cols)]
+    beta = rng.uniform(0.5, 1.5, cols)
+    returns = market * beta + sectors + rng.normal(0, 0.0008, (rows, cols))
+    close = np.round(rng.uniform(100, 3000, cols) * np.exp(np.cumsum(returns, axis=0)) * 20) / 20
+    close[rng.random(close.shape) < missing] = np.nan
+    values = np.full((rows, cols, 5), np.nan)
+    values[:, :, 3] = close
+    return index, list(symbols), values
+
+def pandas_reference(panel, end, window):
+    """Full recomputation over the window ending at bar `end` (same return convention)"""
+    index, symbols, values = panel
+    returns = pd.DataFrame(values[:end + 1, :, 3], columns=symbols).ffill().pct_change().fillna(0)
+    returns['^BENCH'] = returns.mean(axis=1)
+    recent = returns.iloc[-window:]
+    cov = recent.cov()
+    return recent[symbols].corr().to_numpy(), (cov['^BENCH'] / cov.loc['^BENCH', '^BENCH'])[symbols].to_numpy()
+
+def verify(symbols, index, window):
+    panel = factor_panel(symbols, index)
+    print(f"Check vs pandas ({len(symbols)} symbols, window {window}):")
+    for dtype in ('float64', 'float32'):
+        tracker = correlation.RollingCorrelation(symbols, window, dtype=dtype)
+        worst_corr = worst_beta = 0.0
+        for end in (window // 2, 150, 263, len(index) - 1):
+            tracker.feed((index[:end + 1], panel[1], panel[2][:end + 1]))
+            corr, beta = pandas_reference(panel, end, min(window, end + 1))
+            worst_corr = max(worst_corr, float(np.nanmax(np.abs(tracker.correlation() - corr))))
+            worst_beta = max(worst_beta, float(np.nanmax(np.abs(tracker.betas() - beta))))
+        # Warm start (what a fresh fetch run does): prime from the last window + 1 bars only
+        primed = correlation.RollingCorrelation(symbols, window, dtype=dtype)
+        carried = panel[2].copy()
+        carried[:, :, 3] = pd.DataFrame(carried[:, :, 3]).ffill().to_numpy()   # as correlation.load_recent
+        primed.prime((index[-window - 1:], panel[1], carried[-window - 1:]))
+        worst_primed = float(np.nanmax(np.abs(primed.correlation() - tracker.correlation())))
+        top = tracker.top_pairs(3)
+        print(f"  {dtype}: max |corr diff| {worst_corr:.1e}, max |beta diff| {worst_beta:.1e}, "
+              f"primed vs fed {worst_primed:.1e}, top pair {top[0][0]}/{top[0][1]} {top[0][2]:+.3f}")
+
+def timed(func, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return sorted(times)[len(times) // 2] * 1000
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[500, 1500, 3000])
+    parser.add_argument('--window', type=int, default=correlation.WINDOW)
+    parser.add_argument('--top', type=int, default=20)
+    args = parser.parse_args()
+
+    index = session_index(date(2025, 9, 1), date(2025, 9, 2))
+    verify(universe(500), index, args.window)
+
+    print(f"\n{'symbols':>7} {'dtype':>8} {'state MB':>9} {'update ms':>10} {'corr ms':>8} "
+          f"{'top-k ms':>9} {'pandas ms':>10}")
+    for size in args.sizes:
+        symbols = universe(size)
+        panel = factor_panel(symbols, index, seed=size)
+        recent = pd.DataFrame(panel[2][-args.window:, :, 3], columns=symbols).ffill().pct_change().fillna(0)
+        full = timed(recent.corr, 3)
+        for dtype in ('float64', 'float32'):
+            tracker = correlation.RollingCorrelation(symbols, args.window, dtype=dtype)
+            warm = len(index) - 40
+            tracker.feed((index[:warm], symbols, panel[2][:warm]))
+            closes = iter(panel[2][warm:, :, 3])
+            update = timed(lambda: tracker.update(next(closes)), 39)
+            corr = tracker.correlation()
+            print(f"{size:>7} {dtype:>8} {tracker.nbytes() / 1e6:>9.0f} {update:>10.2f} "
+                  f"{timed(tracker.correlation, 5):>8.1f} {timed(lambda: tracker.top_pairs(args.top, corr=corr), 5):>9.1f} "
+                  f"{full:>10.0f}")
+
+if __name__ == "__main__":
+    main()
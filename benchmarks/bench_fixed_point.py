@@ -0,0 +1,131 @@
+import argparse
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+import zlib
+from datetime import date
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import ingest
+from synthetic import make_frame, session_index, universe
+
+"""
+REAL vs integer-paise price storage
+Builds float32-derived prices (what yfinance hands us, e.g. 990.9000244140625)
+with a few off-grid values mixed in, stores them in a REAL DB and a paise DB,
+and reports file size, zlib ratio of the archived days (DB file and CSV
+dump), the SQLite cost of re-writing unchanged rows (the UPSERT skips them,
+the old INSERT OR REPLACE rewrote them) and the decoded round trip.
+
+Usage: python benchmarks/bench_fixed_point.py --symbols 500 --days 5
+"""
+
+OLD_REPLACE = '''
+    INSERT OR REPLACE INTO stock_1min_data
+    (symbol, datetime, open, high, low, close, volume)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+'''
+
+def yahoo_like(frame, off_grid=0.001, seed=1):
+    """float32 round trip of the prices plus a sprinkling of off-grid values"""
+    frame = frame.copy()
+    prices = [c for c in frame.columns if c[1] != 'Volume']
+    values = frame[prices].to_numpy().astype(np.float32).astype(np.float64)
+    rng = np.random.default_rng(seed)
+    odd = rng.random(values.shape) < off_grid
+    values[odd] += 0.0037
+    frame[prices] = values
+    return frame, int(odd.sum())
+
+def file_stats(db_path):
+    """(bytes after VACUUM, zlib ratio of the file, zlib ratio of a CSV dump of the table)"""
+    conn = sqlite3.connect(db_path)
+    conn.execute('PRAGMA journal_mode=DELETE')
+    conn.execute('VACUUM')
+    dump = '\n'.join(','.join(map(str, row)) for row in conn.execute(
+        'SELECT symbol, datetime, open, high, low, close, volume FROM stock_1min_data')).encode()
+    conn.close()
+    with open(db_path, 'rb') as f:
+        raw = f.read()
+    return len(raw), len(raw) / len(zlib.compress(raw, 6)), len(dump), len(dump) / len(zlib.compress(dump, 6))
+
+def restore(db_path, frame, symbols, old_replace=False):
+    """Re-write the same (pre-encoded) rows; (seconds, rows actually written)"""
+    conn = ingest.connect(db_path)
+    scale = ingest.PRICE_SCALES.get(ingest.get_price_encoding(conn))
+    rows = list(ingest.frame_to_rows(frame, symbols, scale))
+    before = conn.total_changes
+    start = time.perf_counter()
+    for chunk in ingest.iter_chunks(rows):
+        if old_replace:
+            conn.executemany(OLD_REPLACE, chunk)
+        else:
+            ingest.bulk_insert(conn, chunk)
+    conn.commit()
+    elapsed = time.perf_counter() - start
+    written = conn.total_changes - before
+    conn.close()
+    return elapsed, written
+
+def decoded_error(db_path, frame, symbols):
+    """Max |view close - snapped input close| over every stored candle"""
+    conn = sqlite3.connect(db_path)
+    stored = dict(((s, d), c) for s, d, c in conn.execute(
+        'SELECT symbol, datetime, close FROM stock_1min_prices'))
+    conn.close()
+    stamps = frame.index.strftime('%Y-%m-%d %H:%M:%S')
+    worst = 0.0
+    for symbol in symbols:
+        expected = ingest.snap_prices(frame[(symbol, 'Close')].to_numpy())
+        got = np.array([stored[(symbol, stamp)] for stamp in stamps])
+        worst = max(worst, float(np.abs(got - expected).max()))
+    return worst
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--symbols', type=int, default=500)
+    parser.add_argument('--days', type=int, default=5)
+    args = parser.parse_args()
+
+    symbols = universe(args.symbols)
+    index = session_index(date(2025, 9, 1), date(2025, 9, 1 + args.days + 2))[:375 * args.days]
+    frame, odd = yahoo_like(make_frame(symbols, index))
+    print(f"{args.symbols} symbols x {len(index)} bars, {odd} off-grid prices\n")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        results = {}
+        for encoding in (None, 'paise'):
+            label = encoding or 'real'
+            db_path = os.path.join(tmp, f'{label}.db')
+            ingest.create_database(db_path, encoding)
+
+            conn = ingest.connect(db_path)
+            start = time.perf_counter()
+            ingest.store_frame(conn, frame, symbols)
+            conn.commit()
+            first = time.perf_counter() - start
+            conn.close()
+
+            upsert = restore(db_path, frame, symbols)
+            replace = restore(db_path, frame, symbols, old_replace=True)
+            results[label] = (first, upsert, replace, decoded_error(db_path, frame, symbols), file_stats(db_path))
+
+        print(f"{'':<6} {'first store':>11} {'re-store':>16} {'old REPLACE':>18} {'max err':>9} "
+              f"{'DB MB':>7} {'DB zlib':>8} {'CSV MB':>7} {'CSV zlib':>9}")
+        for label, (first, upsert, replace, error, (size, ratio, csv, csv_ratio)) in results.items():
+            print(f"{label:<6} {first:>10.2f}s {upsert[0]:>6.2f}s {upsert[1]:>7,} rows "
+                  f"{replace[0]:>6.2f}s {replace[1]:>9,} rows {error:>9.2g} "
+                  f"{size / 1e6:>7.1f} {ratio:>7.2f}x {csv / 1e6:>7.1f} {csv_ratio:>8.2f}x")
+
+        real, paise = results['real'][4], results['paise'][4]
+        print(f"\npaise vs real: DB {paise[0] / real[0] - 1:+.1%}, "
+              f"compressed DB {(paise[0] / paise[1]) / (real[0] / real[1]) - 1:+.1%}, "
+              f"compressed CSV {(paise[2] / paise[3]) / (real[2] / real[3]) - 1:+.1%}")
+
+if __name__ == "__main__":
+    main()
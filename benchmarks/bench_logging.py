@@ -0,0 +1,84 @@
+import argparse
+import logging
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+"""
+Logging overhead per run: old basicConfig(FileHandler + StreamHandler)
+vs log_setup (QueueHandler -> QueueListener, aggregated yfinance errors).
+Replays one run's worth of records: banners, per-batch lines and one
+yfinance error block per failing symbol (as in data_fetch.log after close).
+
+Usage: python benchmarks/bench_logging.py --symbols 1500 --failing 1500
+"""
+
+def replay(symbols, failing, batch_size=500):
+    """Emit the records of one fetch run; returns seconds spent in logging calls"""
+    yf_logger = logging.getLogger('yfinance')
+    started = time.perf_counter()
+    logging.info("=" * 70)
+    logging.info("🚀 GitHub Actions - Stock Fetcher (BATCH MODE)")
+    for batch in range(0, symbols, batch_size):
+        logging.info(f"\n{'=' * 70}")
+        logging.info(f"🔄 Processing Batch {batch // batch_size + 1}")
+        logging.info(f"📊 Batch {batch // batch_size + 1}: Fetching {batch_size} stocks...")
+        logging.info(f"✅ Batch {batch // batch_size + 1}: Fetched in 3.21 seconds")
+        logging.info(f"💾 Batch {batch // batch_size + 1}: Stored 0 candles from 0/{batch_size} stocks")
+    for i in range(failing):
+        yf_logger.error('\n1 Failed download:')
+        yf_logger.error(f"['SYM{i:04d}.NS']: Exception('%ticker%: No price data found, "
+                        f"symbol may be delisted (period=1d)')")
+    return time.perf_counter() - started
+
+def child(mode, symbols, failing, log_file):
+    """Configure logging one way, replay, print hot-path seconds and total seconds"""
+    sys.stderr = open(os.devnull, 'w')
+    started = time.perf_counter()
+    if mode == 'old':
+        logging.basicConfig(
+            level=logging.INFO,
+            format='%(asctime)s - %(levelname)s - %(message)s',
+            handlers=[logging.FileHandler(log_file), logging.StreamHandler()]
+        )
+        hot = replay(symbols, failing)
+    else:
+        import log_setup
+        log_setup.setup_logging(log_file)
+        hot = replay(symbols, failing)
+        log_setup.shutdown_logging()
+    total = time.perf_counter() - started
+    print(hot, total)
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--symbols', type=int, default=1500)
+    parser.add_argument('--failing', type=int, default=1500)
+    parser.add_argument('--child', help=argparse.SUPPRESS)
+    parser.add_argument('--log-file', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        child(args.child, args.symbols, args.failing, args.log_file)
+        return
+
+    print(f"{'mode':<6} {'hot path':>10} {'incl. flush':>12} {'log bytes':>10} {'lines':>7}")
+    for mode in ('old', 'queue'):
+        with tempfile.TemporaryDirectory() as tmp:
+            log_file = os.path.join(tmp, 'run.log')
+            out = subprocess.run(
+                [sys.executable, __file__, '--child', mode, '--log-file', log_file,
+                 '--symbols', str(args.symbols), '--failing', str(args.failing)],
+                capture_output=True, text=True, check=True).stdout.split()
+            hot, total = (float(x) * 1000 for x in out)
+            with open(log_file, 'rb') as f:
+                data = f.read()
+            lines = data.count(b'\n')
+            print(f"{mode:<6} {hot:>7.1f} ms {total:>9.1f} ms {len(data):>10,} {lines:>7,}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+import argparse
+import os
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import threading
+import tracemalloc
+from datetime import date
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import ingest
+from synthetic import make_frame, session_index, universe
+
+"""
+Peak memory of the transform + write stage as batch size grows
+'materialize' builds every row of the batch before writing (the old
+store_data behaviour); 'stream' is ingest.store_frame.
+Each measurement runs in a fresh subprocess. RSS growth is the highest
+current RSS (/proc/self/statm, sampled every millisecond) during the store
+minus the RSS right before it - ru_maxrss would be the lifetime peak, which
+building the frame already sets. Linux only.
+
+Usage: python benchmarks/bench_memory.py --sizes 100 500 1000 2000
+"""
+
+PAGE_SIZE = os.sysconf('SC_PAGE_SIZE')
+
+def current_rss():
+    """Resident set size right now, in bytes"""
+    with open('/proc/self/statm') as f:
+        return int(f.read().split()[1]) * PAGE_SIZE
+
+class RssPeak:
+    """Highest current RSS seen while running"""
+
+    def __init__(self, interval=0.001):
+        self.interval = interval
+        self.peak = current_rss()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.peak = max(self.peak, current_rss())
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+        self.peak = max(self.peak, current_rss())
+
+def measure(mode, batch_size):
+    """Run one store in this process; print tracemalloc peak and RSS growth"""
+    symbols = universe(batch_size)
+    frame = make_frame(symbols, session_index(date(2025, 9, 1), date(2025, 9, 2)))
+    # On-disk DB so the page cache doesn't count as transform memory
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, 'bench.db')
+        ingest.create_database(db_path)
+        conn = sqlite3.connect(db_path)
+        rss_before = current_rss()
+        tracemalloc.start()
+
+        with RssPeak() as rss:
+            if mode == 'materialize':
+                ingest.bulk_insert(conn, list(ingest.frame_to_rows(frame, symbols)))
+            else:
+                ingest.store_frame(conn, frame, symbols)
+            conn.commit()
+
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(peak, rss.peak - rss_before)
+        conn.close()
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100, 500, 1000, 2000])
+    parser.add_argument('--child', nargs=2, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        measure(args.child[0], int(args.child[1]))
+        return
+
+    print(f"{'batch':>6} {'mode':<12} {'tracemalloc peak':>17} {'RSS growth':>11}")
+    for size in args.sizes:
+        for mode in ('materialize', 'stream'):
+            out = subprocess.run([sys.executable, __file__, '--child', mode, str(size)],
+                                 capture_output=True, text=True, check=True).stdout.split()
+            peak, rss = (int(x) / 2 ** 20 for x in out)
+            print(f"{size:>6} {mode:<12} {peak:>14.1f} MB {rss:>8.1f} MB")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+import argparse
+import asyncio
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import date
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import ingest
+import screener
+import snapshot
+from synthetic import make_frame, session_index, universe
+
+"""
+Load test for read_service.py with many concurrent polling clients
+Each poller keeps one connection open and repeatedly asks for /quotes
+with If-None-Match + gzip, like a dashboard would.
+
+Usage: python benchmarks/bench_read_service.py --clients 200 --seconds 10
+"""
+
+async def poller(host, port, path, deadline, latencies, statuses):
+    """One keep-alive client polling a path until the deadline"""
+    reader, writer = await asyncio.open_connection(host, port)
+    etag = None
+    while time.perf_counter() < deadline:
+        request = f'GET {path} HTTP/1.1\r\nHost: {host}\r\nAccept-Encoding: gzip\r\n'
+        if etag:
+            request += f'If-None-Match: {etag}\r\n'
+        started = time.perf_counter()
+        writer.write((request + '\r\n').encode())
+        head = await reader.readuntil(b'\r\n\r\n')
+        lines = head.decode('latin-1').split('\r\n')
+        headers = {k.lower(): v.strip() for k, _, v in (l.partition(':') for l in lines[1:] if l)}
+        length = int(headers.get('content-length', 0))
+        if length:
+            await reader.readexactly(length)
+        latencies.append(time.perf_counter() - started)
+        status = int(lines[0].split(' ')[1])
+        statuses[status] = statuses.get(status, 0) + 1
+        etag = headers.get('etag', etag)
+    writer.close()
+
+async def load(host, port, clients, seconds, path):
+    latencies, statuses = [], {}
+    deadline = time.perf_counter() + seconds
+    started = time.perf_counter()
+    await asyncio.gather(*(poller(host, port, path, deadline, latencies, statuses) for _ in range(clients)))
+    return latencies, statuses, time.perf_counter() - started
+
+def build_db(tmp, symbols):
+    """Synthetic session in a temp DB + snapshot"""
+    db_path = os.path.join(tmp, 'bench.db')
+    snap_path = os.path.join(tmp, 'latest_snapshot.bin')
+    names = universe(symbols)
+    frame = make_frame(names, session_index(date(2025, 9, 1), date(2025, 9, 2)))
+    ingest.create_database(db_path)
+    conn = ingest.connect(db_path)
+    ingest.store_frame(conn, frame, names)
+    conn.commit()
+    conn.close()
+    snapshot.publish(snap_path, screener.to_panel(frame, names))
+    return db_path, snap_path
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--clients', type=int, default=200)
+    parser.add_argument('--seconds', type=float, default=10)
+    parser.add_argument('--symbols', type=int, default=1500)
+    parser.add_argument('--path', default='/quotes')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path, snap_path = build_db(tmp, args.symbols)
+        port = free_port()
+        server = subprocess.Popen([sys.executable, os.path.join(ROOT, 'read_service.py'), '--db', db_path,
+                                   '--snapshot', snap_path, '--port', str(port)],
+                                  stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        try:
+            for _ in range(100):
+                try:
+                    socket.create_connection(('127.0.0.1', port)).close()
+                    break
+                except OSError:
+                    time.sleep(0.1)
+            latencies, statuses, elapsed = asyncio.run(
+                load('127.0.0.1', port, args.clients, args.seconds, args.path))
+        finally:
+            server.terminate()
+            server.wait()
+
+    latencies.sort()
+    pct = lambda p: latencies[min(len(latencies) - 1, int(p * len(latencies)))] * 1000
+    print(f"{args.clients} pollers on {args.path} for {args.seconds:g}s ({args.symbols} symbols)")
+    print(f"  requests/sec {len(latencies) / elapsed:,.0f}")
+    print(f"  p50 {pct(0.50):.2f} ms   p99 {pct(0.99):.2f} ms")
+    print(f"  statuses {dict(sorted(statuses.items()))}")
+
+if __name__ == "__main__":
+    main()
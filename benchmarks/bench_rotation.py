@@ -0,0 +1,85 @@
+import argparse
+import os
+import sqlite3
+import sys
+import tempfile
+from datetime import date, timedelta
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import journal
+import market_calendar
+import profiles
+from synthetic import universe
+
+"""
+Per-symbol staleness over a session when runs get cut short
+Simulates one run per minute over a full session; each run is cancelled
+after a random number of batches. 'fixed' always starts again from batch 1
+(the old loop), 'journal' resumes the unfinished cycle and orders batches
+stalest-first. Both are written through journal.record and reported with
+journal.report, so the output matches `python journal.py --report`.
+
+Usage: python benchmarks/bench_rotation.py --symbols 1500 --batch-size 500
+"""
+
+def simulate(db_path, mode, symbols, batch_size, budgets, day, batch_seconds):
+    """Run a session of cut-short cycles; returns the report text"""
+    open_at, close_at = market_calendar.session_bounds(day)
+    moment = open_at
+    for budget in budgets:
+        if moment > close_at:
+            break
+        if mode == 'fixed':
+            cycle = journal.Cycle(mode, moment.isoformat(), set())
+            order = symbols
+        else:
+            cycle = journal.open_cycle(db_path, mode, moment, profiles.previous_fire('* * * * *', moment))
+            remaining = [s for s in symbols if s not in cycle.done]
+            order = journal.rotate(remaining, journal.last_commits(db_path, mode, day))
+
+        batches = [order[i:i + batch_size] for i in range(0, len(order), batch_size)]
+        conn = sqlite3.connect(db_path)
+        for k, batch in enumerate(batches[:budget]):
+            journal.record(conn, cycle, batch, batch, moment + timedelta(seconds=batch_seconds * (k + 1)))
+            conn.commit()
+        conn.close()
+        if budget >= len(batches):
+            journal.close_cycle(db_path, mode)
+        moment += timedelta(minutes=1)
+
+    conn = sqlite3.connect(db_path)
+    try:
+        return journal.report(conn, mode, day, symbols)
+    finally:
+        conn.close()
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--symbols', type=int, default=1500)
+    parser.add_argument('--batch-size', type=int, default=500)
+    parser.add_argument('--batch-seconds', type=float, default=15)
+    parser.add_argument('--cut-rate', type=float, default=0.6, help='share of runs cancelled early')
+    args = parser.parse_args()
+
+    symbols = universe(args.symbols)
+    batches = -(-args.symbols // args.batch_size)
+    rng = np.random.default_rng(7)
+    # Cancelled runs finish 0..batches-1 batches, the rest finish everything
+    budgets = np.where(rng.random(400) < args.cut_rate, rng.integers(0, batches, 400), batches)
+    day = date(2025, 9, 1)
+    print(f"{args.symbols} symbols, {batches} batches per run, {args.cut_rate:.0%} of runs cut short\n")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, 'journal.db')
+        conn = sqlite3.connect(db_path)
+        journal.create_tables(conn)
+        conn.close()
+        for mode in ('fixed', 'journal'):
+            print(simulate(db_path, mode, symbols, args.batch_size, budgets.tolist(), day, args.batch_seconds))
+            print()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+import argparse
+import os
+import sqlite3
+import sys
+import time
+from datetime import date
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import screener
+from synthetic import make_frame, session_index, universe
+
+"""
+Screener latency on a full-session frame
+
+Usage: python benchmarks/bench_screener.py --symbols 1500 --batch-size 500
+"""
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--symbols', type=int, default=1500)
+    parser.add_argument('--batch-size', type=int, default=500)
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    symbols = universe(args.symbols)
+    index = session_index(date(2025, 9, 1), date(2025, 9, 2))
+    batches = [symbols[i:i + args.batch_size] for i in range(0, len(symbols), args.batch_size)]
+    frames = [make_frame(batch, index, seed=i) for i, batch in enumerate(batches)]
+
+    conn = sqlite3.connect(':memory:')
+    timings = {'to_panel': [], 'compute': [], 'store': []}
+    for _ in range(args.repeat):
+        t0 = time.perf_counter()
+        panels = [screener.to_panel(frame, batch) for frame, batch in zip(frames, batches)]
+        panel = screener.merge_panels(panels)
+        t1 = time.perf_counter()
+        result = screener.compute(panel)
+        t2 = time.perf_counter()
+        rows = screener.store(conn, result)
+        conn.commit()
+        t3 = time.perf_counter()
+        timings['to_panel'].append(t1 - t0)
+        timings['compute'].append(t2 - t1)
+        timings['store'].append(t3 - t2)
+
+    print(f"{args.symbols} symbols x {len(index)} bars, {rows} flagged rows/minute")
+    for stage, values in timings.items():
+        print(f"  {stage:<9} median {sorted(values)[len(values) // 2] * 1000:7.2f} ms")
+    total = [sum(v) for v in zip(*timings.values())]
+    print(f"  {'total':<9} median {sorted(total)[len(total) // 2] * 1000:7.2f} ms")
+
+if __name__ == "__main__":
+    main()
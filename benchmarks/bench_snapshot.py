@@ -0,0 +1,88 @@
+import argparse
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+from datetime import date
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import screener
+import snapshot
+from synthetic import make_frame, session_index, universe
+
+"""
+Snapshot writer cost, reader latency and torn-read check
+A second process publishes continuously (every record of a publish has
+the same close) while the reader verifies it never sees a mix.
+
+Usage: python benchmarks/bench_snapshot.py --symbols 1500
+"""
+
+def hammer(path, symbols, stop):
+    """Publish as fast as possible until told to stop"""
+    writer = snapshot.SnapshotWriter(path)
+    records = np.zeros(len(symbols), dtype=snapshot.RECORD)
+    n = 0
+    while not stop.is_set():
+        n += 1
+        records['close'] = n
+        writer.publish(symbols, records, n)
+    writer.close()
+
+def median_us(fn, repeat):
+    """Median wall time of fn() in microseconds"""
+    times = []
+    for _ in range(repeat):
+        t = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - t)
+    return sorted(times)[len(times) // 2] * 1e6
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--symbols', type=int, default=1500)
+    parser.add_argument('--repeat', type=int, default=2000)
+    parser.add_argument('--seconds', type=float, default=2.0)
+    args = parser.parse_args()
+
+    symbols = universe(args.symbols)
+    frame = make_frame(symbols, session_index(date(2025, 9, 1), date(2025, 9, 2)))
+    panel = screener.to_panel(frame, symbols)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'latest_snapshot.bin')
+        snapshot.publish(path, panel)
+        print(f"{args.symbols} symbols, file {os.path.getsize(path):,} bytes")
+        print(f"  publish() incl. open/map    {median_us(lambda: snapshot.publish(path, panel), 200):9.1f} us")
+
+        writer = snapshot.SnapshotWriter(path)
+        records = snapshot.latest_records(panel)
+        print(f"  writer.publish() bulk write {median_us(lambda: writer.publish(symbols, records, 0), args.repeat):9.1f} us")
+        writer.close()
+
+        reader = snapshot.SnapshotReader(path)
+        print(f"  reader.get(symbol)          {median_us(lambda: reader.get(symbols[7]), args.repeat):9.1f} us")
+        print(f"  reader.latest() all records {median_us(reader.latest, args.repeat):9.1f} us")
+
+        stop = multiprocessing.Event()
+        proc = multiprocessing.Process(target=hammer, args=(path, symbols, stop))
+        proc.start()
+        time.sleep(0.2)
+        reads = torn = 0
+        deadline = time.time() + args.seconds
+        while time.time() < deadline:
+            _, records = reader.latest()
+            reads += 1
+            if records['close'].min() != records['close'].max():
+                torn += 1
+        stop.set()
+        proc.join()
+        reader.close()
+        print(f"  concurrent: {reads:,} consistent reads checked, {torn} torn")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+import numpy as np
+import pandas as pd
+
+"""
+Synthetic yf.download-shaped frames for the local benchmarks
+"""
+
+FIELDS = ['Open', 'High', 'Low', 'Close', 'Volume']
+
+def session_index(start, end, interval='1m'):
+    """Trading timestamps (IST, 09:15-15:29) between two dates for an interval"""
+    freq = {'1m': '1min', '5m': '5min', '60m': '60min', '1d': '1D'}[interval]
+    days = pd.bdate_range(start, end, inclusive='left')
+    if interval == '1d':
+        return days.tz_localize('Asia/Kolkata')
+    minutes = pd.timedelta_range('09:15:00', '15:29:00', freq=freq)
+    stamps = (days.values[:, None] + minutes.values[None, :]).ravel()
+    return pd.DatetimeIndex(stamps).tz_localize('Asia/Kolkata')
+
+def make_frame(symbols, index, seed=0):
+    """Wide (symbol, field) float64 frame like yf.download(group_by='ticker')"""
+    rng = np.random.default_rng(seed)
+    rows, cols = len(index), len(symbols)
+    base = rng.uniform(100, 3000, cols)
+    close = base * np.exp(np.cumsum(rng.normal(0, 0.0008, (rows, cols)), axis=0))
+    close = np.round(close * 20) / 20
+    spread = np.round(close * 0.001 * 20) / 20
+    volume = rng.integers(100, 50000, (rows, cols)).astype('float64')
+
+    blocks = {'Open': np.round((close - spread) * 20) / 20, 'High': np.round((close + spread) * 20) / 20,
+              'Low': np.round((close - 2 * spread) * 20) / 20, 'Close': close, 'Volume': volume}
+    values = np.empty((rows, cols * len(FIELDS)))
+    for j, field in enumerate(FIELDS):
+        values[:, j::len(FIELDS)] = blocks[field]
+    columns = pd.MultiIndex.from_product([symbols, FIELDS])
+    return pd.DataFrame(values, index=index, columns=columns)
+
+def universe(count):
+    """Fake symbol names"""
+    return [f'SYM{i:04d}.NS' for i in range(count)]
@@ -0,0 +1,311 @@
+import argparse
+import logging
+import sqlite3
+import time
+import numpy as np
+import pandas as pd
+import profiles
+
+"""
+Rolling Correlation / Beta - incremental, whole universe at once
+Keeps rolling sums of 1-minute returns, their squares and all cross
+products over a fixed window in NumPy arrays. Each new minute is one
+O(symbols^2) rank-2 update (add the new return vector, drop the one that
+leaves the window); the correlation matrix, betas and top-k pairs are
+derived on demand. Missing bars count as an unchanged price (return 0).
+The sums are rebuilt from the ring buffer every `window` minutes, so
+float32 state (half the memory) does not drift.
+
+Beta is against the benchmark column: the NIFTY 50 index, which data_fetch
+stores with every profile. Data without it (e.g. a DB filled before that)
+falls back to the equal-weighted mean return of the universe.
+
+In the fetch cycle (data_fetch.py) every run is a fresh process: the
+tracker is primed from the last `window` stored bars of the profile DB
+(one GEMM), then fed the bars the run just stored. The latest betas and
+top pairs are kept in the rolling_beta / correlated_pairs tables.
+
+Usage: python correlation.py --db nifty50_top20.db [--day 2025-09-01] [--window 60] [--top 20]
+"""
+
+WINDOW = 60          # Minutes in the rolling window
+BENCHMARK = profiles.BENCHMARK   # NIFTY 50, stored by data_fetch with every profile
+TOP_PAIRS = 20       # Rows kept in correlated_pairs
+STAMP = '%Y-%m-%d %H:%M:%S'   # Format of the stored datetime column
+
+class RollingCorrelation:
+    """Rolling return moments for a fixed symbol list (+ one benchmark column)"""
+
+    def __init__(self, symbols, window=WINDOW, benchmark=BENCHMARK, dtype='float64', rebuild_every=None):
+        self.symbols = [s for s in dict.fromkeys(symbols) if s != benchmark]
+        self.benchmark = benchmark
+        self.columns = {symbol: i for i, symbol in enumerate(self.symbols)}
+        self.window = window
+        self.dtype = np.dtype(dtype)
+        self.rebuild_every = rebuild_every or window
+
+        size = len(self.symbols) + 1   # last column = benchmark
+        self.ring = np.zeros((window, size), dtype=self.dtype)
+        self.sums = np.zeros(size, dtype=self.dtype)
+        self.squares = np.zeros(size, dtype=self.dtype)
+        self.cross = np.zeros((size, size), dtype=self.dtype)
+        self._scratch = np.empty((size, size), dtype=self.dtype)
+        self._left = np.empty((size, 2), dtype=self.dtype)
+        self._right = np.empty((2, size), dtype=self.dtype)
+        self.last_close = np.full(size, np.nan)
+        self.last_time = None
+        self.count = 0
+        self.updates = 0
+
+    def nbytes(self):
+        return sum(a.nbytes for a in (self.ring, self.sums, self.squares, self.cross, self._scratch))
+
+    def _returns(self, close):
+        """Close vector (NaN = no bar) -> return vector, carrying the last price forward"""
+        with np.errstate(invalid='ignore', divide='ignore'):
+            returns = close / self.last_close - 1
+        returns[np.isnan(returns)] = 0
+        self.last_close = np.where(np.isnan(close), self.last_close, close)
+        return returns.astype(self.dtype)
+
+    def _push(self, close, benchmark_close):
+        """Put one minute's return vector into the ring -> (new, replaced) vectors"""
+        close = np.append(np.asarray(close, dtype='float64'),
+                          np.nan if benchmark_close is None else benchmark_close)
+        returns = self._returns(close)
+        if benchmark_close is None:
+            returns[-1] = returns[:-1].mean()
+
+        slot = self.updates % self.window
+        old = self.ring[slot].copy()
+        self.ring[slot] = returns
+        self.updates += 1
+        self.count = min(self.count + 1, self.window)
+        return returns, old
+
+    def update(self, close, benchmark_close=None):
+        """Add one minute of closes (in symbol order); O(symbols^2)"""
+        returns, old = self._push(close, benchmark_close)
+        if self.updates % self.rebuild_every == 0:
+            self.rebuild()
+            return
+        self.sums += returns - old
+        self.squares += returns * returns - old * old
+        # cross += r r' - old old' as one k=2 matmul (BLAS) + one add
+        self._left[:, 0], self._left[:, 1] = returns, old
+        self._right[0], self._right[1] = returns, -old
+        np.matmul(self._left, self._right, out=self._scratch)
+        self.cross += self._scratch
+
+    def rebuild(self):
+        """Recompute the sums from the ring buffer (unused slots are zero) - one GEMM"""
+        self.sums[:] = self.ring.sum(axis=0, dtype='float64')
+        self.squares[:] = np.square(self.ring, dtype='float64').sum(axis=0)
+        np.matmul(self.ring.T, self.ring, out=self.cross)
+
+    def _minutes(self, panel):
+        """(stamp, closes in symbol order, benchmark close) for the panel's bars newer than the last one seen"""
+        index, symbols, values = panel
+        positions = np.array([self.columns.get(s, -1) for s in symbols], dtype='int64')
+        known = positions >= 0
+        bench = symbols.index(self.benchmark) if self.benchmark in symbols else None
+        if bench is not None and np.isnan(values[:, bench, 3]).all():
+            bench = None   # Requested but never stored -> equal-weighted proxy, as without the column
+        # Compared as stored strings - yfinance panels are tz-aware, panels read from the DB are not
+        for t, stamp in enumerate(index.strftime(STAMP)):
+            if self.last_time is not None and stamp <= self.last_time:
+                continue
+            close = np.full(len(self.symbols), np.nan)
+            close[positions[known]] = values[t, known, 3]
+            yield stamp, close, None if bench is None else values[t, bench, 3]
+
+    def feed(self, panel):
+        """Apply the bars of a screener panel (index, symbols, values) newer than the last one seen"""
+        applied = 0
+        for stamp, close, benchmark_close in self._minutes(panel):
+            self.update(close, benchmark_close)
+            self.last_time = stamp
+            applied += 1
+        return applied
+
+    def prime(self, panel):
+        """Same state as feed(panel), but the sums are built once at the end (one GEMM)"""
+        applied = 0
+        for stamp, close, benchmark_close in self._minutes(panel):
+            self._push(close, benchmark_close)
+            self.last_time = stamp
+            applied += 1
+        if applied:
+            self.rebuild()
+        return applied
+
+    def covariance(self):
+        n = self.count
+        if n < 2:
+            return None
+        return (self.cross - np.multiply.outer(self.sums, self.sums) / n) / (n - 1)
+
+    def correlation(self):
+        """Symbol x symbol correlation matrix (NaN for symbols with no movement)"""
+        cov = self.covariance()
+        if cov is None:
+            return None
+        cov = cov[:-1, :-1]
+        std = np.sqrt(np.clip(np.diagonal(cov), 0, None))
+        with np.errstate(invalid='ignore', divide='ignore'):
+            corr = cov / np.multiply.outer(std, std)
+        corr[:, std <= 0] = np.nan
+        corr[std <= 0, :] = np.nan
+        return np.clip(corr, -1, 1, out=corr)
+
+    def betas(self):
+        """Per-symbol beta vs the benchmark column"""
+        n = self.count
+        if n < 2:
+            return None
+        cov_b = (self.cross[:-1, -1] - self.sums[:-1] * self.sums[-1] / n) / (n - 1)
+        var_b = (self.squares[-1] - self.sums[-1] ** 2 / n) / (n - 1)
+        return cov_b / var_b if var_b > 0 else np.full(len(self.symbols), np.nan)
+
+    def top_pairs(self, k=20, absolute=False, corr=None):
+        """k most correlated distinct pairs -> [(symbol_a, symbol_b, corr)]"""
+        corr = self.correlation() if corr is None else corr
+        if corr is None:
+            return []
+        scores = np.abs(corr) if absolute else corr.copy()
+        scores[np.tri(len(self.symbols), dtype=bool)] = -np.inf   # lower triangle + diagonal
+        scores[np.isnan(scores)] = -np.inf
+        flat = scores.ravel()
+        k = min(k, len(self.symbols) * (len(self.symbols) - 1) // 2)
+        best = np.argpartition(flat, -k)[-k:] if k else np.array([], dtype=int)
+        best = best[np.argsort(flat[best])[::-1]]
+        rows, cols = np.divmod(best, len(self.symbols))
+        return [(self.symbols[i], self.symbols[j], float(corr[i, j]))
+                for i, j in zip(rows, cols) if np.isfinite(flat[i * len(self.symbols) + j])]
+
+def load_panel(conn, day, symbols=None):
+    """One day of stored closes as a screener-style panel (close in field 3)"""
+    query = 'SELECT datetime, symbol, close FROM stock_1min_prices WHERE datetime >= ? AND datetime <= ?'
+    frame = pd.read_sql_query(query, conn, params=(f'{day} 00:00:00', f'{day} 23:59:59'))
+    wide = frame.pivot(index='datetime', columns='symbol', values='close').sort_index()
+    if symbols is not None:
+        wide = wide.reindex(columns=symbols)
+    values = np.full((len(wide), wide.shape[1], 5), np.nan)
+    values[:, :, 3] = wide.to_numpy(dtype='float64')
+    return pd.to_datetime(wide.index), list(wide.columns), values
+
+def load_recent(conn, symbols, bars):
+    """Last `bars` stored minutes of the given symbols as a panel (close in field 3)"""
+    symbols = list(dict.fromkeys(symbols))
+    # One indexed lookup per symbol (symbol, datetime) instead of scanning the day
+    rows = []
+    for symbol in symbols:
+        rows.extend(conn.execute('''
+            SELECT datetime, symbol, close FROM stock_1min_prices
+            WHERE symbol = ? ORDER BY datetime DESC LIMIT ?
+        ''', (symbol, bars)))
+    frame = pd.DataFrame(rows, columns=['datetime', 'symbol', 'close'])
+    # Carried forward before trimming, so a symbol without a bar in the first minute still seeds its last close
+    wide = frame.pivot(index='datetime', columns='symbol', values='close').sort_index().ffill().iloc[-bars:]
+    wide = wide.reindex(columns=symbols)
+    values = np.full((len(wide), len(symbols), 5), np.nan)
+    values[:, :, 3] = wide.to_numpy(dtype='float64')
+    return pd.to_datetime(wide.index), symbols, values
+
+def warm_start(db_path, symbols, window=WINDOW, dtype='float32'):
+    """Tracker primed from the last `window` stored minutes of a profile DB"""
+    tracker = RollingCorrelation(symbols, window, dtype=dtype)
+    conn = sqlite3.connect(db_path)
+    try:
+        # One extra minute: its closes only seed last_close
+        tracker.prime(load_recent(conn, tracker.symbols + [tracker.benchmark], window + 1))
+    finally:
+        conn.close()
+    return tracker
+
+def create_tables(conn):
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS rolling_beta (
+            symbol TEXT PRIMARY KEY,
+            datetime DATETIME NOT NULL,
+            beta REAL,
+            window INTEGER NOT NULL
+        )
+    ''')
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS correlated_pairs (
+            rank INTEGER PRIMARY KEY,
+            datetime DATETIME NOT NULL,
+            symbol_a TEXT NOT NULL,
+            symbol_b TEXT NOT NULL,
+            corr REAL NOT NULL
+        )
+    ''')
+
+def store(conn, tracker, top=TOP_PAIRS):
+    """Replace the latest betas / top pairs - caller commits; returns the pairs"""
+    create_tables(conn)
+    pairs = tracker.top_pairs(top)
+    conn.execute('DELETE FROM correlated_pairs')
+    conn.executemany('INSERT INTO correlated_pairs (rank, datetime, symbol_a, symbol_b, corr) VALUES (?, ?, ?, ?, ?)',
+                     [(rank, tracker.last_time, a, b, value) for rank, (a, b, value) in enumerate(pairs, 1)])
+    conn.executemany('INSERT OR REPLACE INTO rolling_beta (symbol, datetime, beta, window) VALUES (?, ?, ?, ?)',
+                     [(symbol, tracker.last_time, None if np.isnan(beta) else float(beta), tracker.count)
+                      for symbol, beta in zip(tracker.symbols, tracker.betas())])
+    return pairs
+
+def run(tracker, panel, db_path, top=TOP_PAIRS):
+    """Feed the bars a run just stored, then record the latest betas / top pairs"""
+    start_time = time.time()
+    applied = tracker.feed(panel)
+    if not applied or tracker.count < 2:
+        return 0
+    conn = sqlite3.connect(db_path, timeout=30)
+    try:
+        pairs = store(conn, tracker, top)
+        conn.commit()
+    finally:
+        conn.close()
+    elapsed = (time.time() - start_time) * 1000
+    best = f", top pair {pairs[0][0]}/{pairs[0][1]} {pairs[0][2]:+.2f}" if pairs else ''
+    logging.info(f"📈 Correlation: {applied} new minutes, {len(tracker.symbols)} symbols over "
+                 f"{tracker.count} minutes{best} in {elapsed:.1f} ms")
+    return applied
+
+def main():
+    """Replay a stored day minute by minute and print the latest top pairs / betas"""
+    parser = argparse.ArgumentParser(description='Rolling correlation and beta over stored candles')
+    parser.add_argument('--db', default='nifty50_top20.db')
+    parser.add_argument('--day', default=None, help='YYYY-MM-DD (default: latest stored day)')
+    parser.add_argument('--window', type=int, default=WINDOW)
+    parser.add_argument('--top', type=int, default=20)
+    parser.add_argument('--float32', action='store_true')
+    args = parser.parse_args()
+
+    conn = sqlite3.connect(args.db)
+    try:
+        day = args.day or conn.execute('SELECT MAX(datetime) FROM stock_1min_data').fetchone()[0][:10]
+        panel = load_panel(conn, day)
+    finally:
+        conn.close()
+
+    tracker = RollingCorrelation(panel[1], args.window, dtype='float32' if args.float32 else 'float64')
+    start = time.perf_counter()
+    minutes = tracker.feed(panel)
+    elapsed = time.perf_counter() - start
+    print(f"{day}: {len(tracker.symbols)} symbols, {minutes} minutes in {elapsed:.2f}s "
+          f"({elapsed / max(1, minutes) * 1000:.1f} ms/minute, state {tracker.nbytes() / 1e6:.0f} MB)")
+    proxy = '' if tracker.benchmark in panel[1] else ' (equal-weighted proxy)'
+
+    print(f"\nTop {args.top} correlated pairs, last {tracker.count} minutes:")
+    for a, b, value in tracker.top_pairs(args.top):
+        print(f"  {a:<16} {b:<16} {value:+.3f}")
+    betas = tracker.betas()
+    if betas is not None:
+        order = np.argsort(np.nan_to_num(betas, nan=-np.inf))[::-1][:args.top]
+        print(f"\nHighest beta vs {tracker.benchmark}{proxy}:")
+        for i in order:
+            print(f"  {tracker.symbols[i]:<16} {betas[i]:+.2f}")
+
+if __name__ == "__main__":
+    main()
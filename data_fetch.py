@@ -1,325 +1,58 @@
+import argparse
 import os
+import sys
 import sqlite3
 import logging
-from datetime import datetime
+from datetime import datetime, timezone
 import pytz
 import yfinance as yf
 import pandas as pd
 import logging
 from tabulate import tabulate
 import time
+import ingest
+import market_calendar
+import screener
+import log_setup
+import snapshot
+import profiles
+import journal
+import alerts
+import correlation
 
 """
-Stock Data Fetcher - BATCH PROCESSING
-Add your 1500 stock list in STOCK_LIST variable
-Runs every minute via GitHub Actions
+Stock Data Fetcher - BATCH PROCESSING, MULTI-PROFILE
+Universes live in universes.py, profiles (universe, schedule, DB) in profiles.py
+Runs every minute via GitHub Actions: each tick fetches the union of all
+due profiles once and stores it into every profile's database
+
+Usage: python data_fetch.py [--only default v1] [--profile [STAGE ...]]
 """
 
 # Create directories
 os.makedirs('data', exist_ok=True)
 os.makedirs('logs', exist_ok=True)
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('data_fetch.log'),
-        logging.StreamHandler()
-    ]
-)
-
-# ============================================
-# ADD YOUR 1500 STOCK LIST HERE
-# ============================================
-STOCK_LIST = [
-  # Nifty 50 (50 stocks)
-    'RELIANCE.NS', 'TCS.NS', 'HDFCBANK.NS', 'INFY.NS', 'ICICIBANK.NS',
-    'HINDUNILVR.NS', 'ITC.NS', 'SBIN.NS', 'BHARTIARTL.NS', 'KOTAKBANK.NS',
-    'BAJFINANCE.NS', 'LT.NS', 'ASIANPAINT.NS', 'HCLTECH.NS', 'AXISBANK.NS',
-    'MARUTI.NS', 'SUNPHARMA.NS', 'TITAN.NS', 'ULTRACEMCO.NS', 'NESTLEIND.NS',
-    'BAJAJFINSV.NS', 'WIPRO.NS', 'ADANIENT.NS', 'ONGC.NS', 'NTPC.NS',
-    'TECHM.NS', 'POWERGRID.NS', 'M&M.NS', 'TATAMOTORS.NS', 'TATASTEEL.NS',
-    'INDUSINDBK.NS', 'DIVISLAB.NS', 'BAJAJ-AUTO.NS', 'DRREDDY.NS', 'JSWSTEEL.NS',
-    'BRITANNIA.NS', 'CIPLA.NS', 'APOLLOHOSP.NS', 'EICHERMOT.NS', 'GRASIM.NS',
-    'HINDALCO.NS', 'COALINDIA.NS', 'BPCL.NS', 'HEROMOTOCO.NS', 'TATACONSUM.NS',
-    'ADANIPORTS.NS', 'SBILIFE.NS', 'HDFCLIFE.NS', 'UPL.NS', 'SHREECEM.NS',
-    
-    # Nifty Next 50 (50 stocks)
-    'PIDILITIND.NS', 'GODREJCP.NS', 'DABUR.NS', 'BERGEPAINT.NS', 'MARICO.NS',
-    'COLPAL.NS', 'MCDOWELL-N.NS', 'HAVELLS.NS', 'BOSCHLTD.NS', 'SIEMENS.NS',
-    'ABB.NS', 'VEDL.NS', 'HINDZINC.NS', 'BANKBARODA.NS', 'PNB.NS',
-    'CANBK.NS', 'UNIONBANK.NS', 'IDFCFIRSTB.NS', 'BANDHANBNK.NS', 'FEDERALBNK.NS',
-    'IDEA.NS', 'ZEEL.NS', 'DLF.NS', 'GODREJPROP.NS', 'OBEROIRLTY.NS',
-    'AMBUJACEM.NS', 'ACC.NS', 'GAIL.NS', 'IOC.NS', 'PETRONET.NS',
-    'MRF.NS', 'BALKRISIND.NS', 'CUMMINSIND.NS', 'TORNTPHARM.NS', 'LUPIN.NS',
-    'BIOCON.NS', 'AUROPHARMA.NS', 'CADILAHC.NS', 'GLENMARK.NS', 'ALKEM.NS',
-    'TRENT.NS', 'ABFRL.NS', 'PAGEIND.NS', 'PVR.NS', 'JUBLFOOD.NS',
-    'MPHASIS.NS', 'LTTS.NS', 'COFORGE.NS', 'PERSISTENT.NS', 'MINDTREE.NS',
-    
-    # Additional 100 stocks (100-200)
-    'ADANIGREEN.NS', 'ADANIPOWER.NS', 'ADANITRANS.NS', 'AMBUJACFM.NS', 'ASHOKLEY.NS',
-    'AFFLE.NS', 'AIAENG.NS', 'AJANTPHARM.NS', 'APLLTD.NS', 'ALKEM.NS',
-    'AMARAJABAT.NS', 'AMBUJACEM.NS', 'APOLLOTYRE.NS', 'ASHOKLEY.NS', 'ASTRAL.NS',
-    'ATUL.NS', 'AUBANK.NS', 'AUROPHARMA.NS', 'AXISBANK.NS', 'BAJAJCON.NS',
-    'BAJAJHLDNG.NS', 'BAJFINANCE.NS', 'BALKRISIND.NS', 'BALRAMCHIN.NS', 'BANDHANBNK.NS',
-    'BANKBARODA.NS', 'BATAINDIA.NS', 'BEL.NS', 'BERGEPAINT.NS', 'BHARATFORG.NS',
-    'BHARTIARTL.NS', 'BHEL.NS', 'BIOCON.NS', 'BOSCHLTD.NS', 'BPCL.NS',
-    'BRITANNIA.NS', 'BSOFT.NS', 'CANBK.NS', 'CANFINHOME.NS', 'CHAMBLFERT.NS',
-    'CHOLAFIN.NS', 'CIPLA.NS', 'COALINDIA.NS', 'COFORGE.NS', 'COLPAL.NS',
-    'CONCOR.NS', 'COROMANDEL.NS', 'CROMPTON.NS', 'CUB.NS', 'CUMMINSIND.NS',
-    'DABUR.NS', 'DALBHARAT.NS', 'DEEPAKNTR.NS', 'DELTACORP.NS', 'DIVISLAB.NS',
-    'DIXON.NS', 'DLF.NS', 'DRREDDY.NS', 'EICHERMOT.NS', 'ESCORTS.NS',
-    'EXIDEIND.NS', 'FEDERALBNK.NS', 'FORTIS.NS', 'GAIL.NS', 'GLENMARK.NS',
-    'GMRINFRA.NS', 'GNFC.NS', 'GODREJCP.NS', 'GODREJIND.NS', 'GODREJPROP.NS',
-    'GRANULES.NS', 'GRASIM.NS', 'GUJGASLTD.NS', 'HAL.NS', 'HAVELLS.NS',
-    'HCLTECH.NS', 'HDFC.NS', 'HDFCAMC.NS', 'HDFCBANK.NS', 'HDFCLIFE.NS',
-    'HEROMOTOCO.NS', 'HINDALCO.NS', 'HINDCOPPER.NS', 'HINDPETRO.NS', 'HINDUNILVR.NS',
-    'HINDZINC.NS', 'HONAUT.NS', 'ICICIBANK.NS', 'ICICIGI.NS', 'ICICIPRULI.NS',
-    'IDEA.NS', 'IDFCFIRSTB.NS', 'IEX.NS', 'IGL.NS', 'INDHOTEL.NS',
-    'INDIACEM.NS', 'INDIAMART.NS', 'INDIANB.NS', 'INDIGO.NS', 'INDUSINDBK.NS',
-    'INDUSTOWER.NS', 'INFY.NS', 'INTELLECT.NS', 'IOC.NS', 'IPCALAB.NS',
-    'IRB.NS', 'IRCTC.NS', 'ITC.NS', 'JINDALSTEL.NS', 'JKCEMENT.NS',
-    'JSWSTEEL.NS', 'JUBLFOOD.NS', 'JUSTDIAL.NS', 'KANSAINER.NS', 'KEI.NS',
-    'KOTAKBANK.NS', 'L&TFH.NS', 'LALPATHLAB.NS', 'LAURUSLABS.NS', 'LICHSGFIN.NS',
-    'LT.NS', 'LTIM.NS', 'LTTS.NS', 'LUPIN.NS', 'M&M.NS',
-    'M&MFIN.NS', 'MANAPPURAM.NS', 'MARICO.NS', 'MARUTI.NS', 'MCDOWELL-N.NS',
-    'MCX.NS', 'METROPOLIS.NS', 'MFSL.NS', 'MGL.NS', 'MINDTREE.NS',
-    'MOTHERSON.NS', 'MPHASIS.NS', 'MRF.NS', 'MUTHOOTFIN.NS', 'NATIONALUM.NS',
-    'NAUKRI.NS', 'NAVINFLUOR.NS', 'NESTLEIND.NS', 'NMDC.NS', 'NTPC.NS',
-    'OBEROIRLTY.NS', 'OFSS.NS', 'OIL.NS', 'ONGC.NS', 'PAGEIND.NS',
-    'PEL.NS', 'PERSISTENT.NS', 'PETRONET.NS', 'PFC.NS', 'PIDILITIND.NS',
-    'PIIND.NS', 'PNB.NS', 'POLYCAB.NS', 'POWERGRID.NS', 'PVR.NS',
-    'RAIN.NS', 'RAJESHEXPO.NS', 'RAMCOCEM.NS', 'RBLBANK.NS', 'RECLTD.NS',
-    'RELIANCE.NS', 'SAIL.NS', 'SBICARD.NS', 'SBILIFE.NS', 'SBIN.NS',
-    'SHREECEM.NS', 'SIEMENS.NS', 'SRF.NS', 'STARCEMENT.NS', 'SUNPHARMA.NS',
-    'SUNTV.NS', 'SYNGENE.NS', 'TATACHEM.NS', 'TATACOMM.NS', 'TATACONSUM.NS',
-    'TATAMOTORS.NS', 'TATAPOWER.NS', 'TATASTEEL.NS', 'TCS.NS', 'TECHM.NS',
-    'TITAN.NS', 'TORNTPHARM.NS', 'TRENT.NS', 'TVSMOTOR.NS', 'UBL.NS',
-    'ULTRACEMCO.NS', 'UPL.NS', 'VEDL.NS', 'VOLTAS.NS', 'WHIRLPOOL.NS',
-    'WIPRO.NS', 'ZEEL.NS', 'ZOMATO.NS', 'ZYDUSLIFE.NS', '3MINDIA.NS',
-
-# Midcap 150 stocks (200-350)
-    'AARTIIND.NS', 'ABBOTINDIA.NS', 'ABCAPITAL.NS', 'ABFRL.NS', 'ACC.NS',
-    'ADANIENT.NS', 'ADANIPORTS.NS', 'ALKEM.NS', 'AMBUJACEM.NS', 'APOLLOHOSP.NS',
-    'ASHOKLEY.NS', 'ASIANPAINT.NS', 'ASTRAL.NS', 'ATUL.NS', 'AUBANK.NS',
-    'AUROPHARMA.NS', 'AXISBANK.NS', 'BAJAJ-AUTO.NS', 'BAJAJCON.NS', 'BAJAJFINSV.NS',
-    'BAJFINANCE.NS', 'BALKRISIND.NS', 'BALRAMCHIN.NS', 'BANDHANBNK.NS', 'BANKBARODA.NS',
-    'BATAINDIA.NS', 'BEL.NS', 'BERGEPAINT.NS', 'BHARATFORG.NS', 'BHARTIARTL.NS',
-    'BHEL.NS', 'BIOCON.NS', 'BOSCHLTD.NS', 'BPCL.NS', 'BRITANNIA.NS',
-    'BSOFT.NS', 'CANBK.NS', 'CANFINHOME.NS', 'CHAMBLFERT.NS', 'CHOLAFIN.NS',
-    'CIPLA.NS', 'COALINDIA.NS', 'COCHINSHIP.NS', 'COFORGE.NS', 'COLPAL.NS',
-    'CONCOR.NS', 'COROMANDEL.NS', 'CROMPTON.NS', 'CUB.NS', 'CUMMINSIND.NS',
-    'DABUR.NS', 'DALBHARAT.NS', 'DEEPAKNTR.NS', 'DELTACORP.NS', 'DIVISLAB.NS',
-    'DIXON.NS', 'DLF.NS', 'DRREDDY.NS', 'EICHERMOT.NS', 'ESCORTS.NS',
-    'EXIDEIND.NS', 'FEDERALBNK.NS', 'FORTIS.NS', 'GAIL.NS', 'GLENMARK.NS',
-    'GMRINFRA.NS', 'GNFC.NS', 'GODREJCP.NS', 'GODREJIND.NS', 'GODREJPROP.NS',
-    'GRANULES.NS', 'GRASIM.NS', 'GUJGASLTD.NS', 'HAL.NS', 'HAVELLS.NS',
-    'HCLTECH.NS', 'HDFC.NS', 'HDFCAMC.NS', 'HDFCBANK.NS', 'HDFCLIFE.NS',
-    'HEROMOTOCO.NS', 'HINDALCO.NS', 'HINDCOPPER.NS', 'HINDPETRO.NS', 'HINDUNILVR.NS',
-    'HINDZINC.NS', 'HONAUT.NS', 'ICICIBANK.NS', 'ICICIGI.NS', 'ICICIPRULI.NS',
-    'IDEA.NS', 'IDFCFIRSTB.NS', 'IEX.NS', 'IGL.NS', 'INDHOTEL.NS',
-    'INDIACEM.NS', 'INDIAMART.NS', 'INDIANB.NS', 'INDIGO.NS', 'INDUSINDBK.NS',
-    'INDUSTOWER.NS', 'INFY.NS', 'INTELLECT.NS', 'IOC.NS', 'IPCALAB.NS',
-    'IRB.NS', 'IRCTC.NS', 'ITC.NS', 'JINDALSTEL.NS', 'JKCEMENT.NS',
-    'JSWSTEEL.NS', 'JUBLFOOD.NS', 'JUSTDIAL.NS', 'KANSAINER.NS', 'KEI.NS',
-    'KOTAKBANK.NS', 'L&TFH.NS', 'LALPATHLAB.NS', 'LAURUSLABS.NS', 'LICHSGFIN.NS',
-    'LT.NS', 'LTIM.NS', 'LTTS.NS', 'LUPIN.NS', 'M&M.NS',
-    'M&MFIN.NS', 'MANAPPURAM.NS', 'MARICO.NS', 'MARUTI.NS', 'MCDOWELL-N.NS',
-    'MCX.NS', 'METROPOLIS.NS', 'MFSL.NS', 'MGL.NS', 'MINDTREE.NS',
-    'MOTHERSON.NS', 'MPHASIS.NS', 'MRF.NS', 'MUTHOOTFIN.NS', 'NATIONALUM.NS',
-    
-    # Smallcap stocks (350-600)
-    'AAVAS.NS', 'ACE.NS', 'ADANIENSOL.NS', 'AFFLE.NS', 'AIAENG.NS',
-    'AJANTPHARM.NS', 'APLLTD.NS', 'APOLLOTYRE.NS', 'AMBER.NS', 'ANGELONE.NS',
-    'ANURAS.NS', 'APARINDS.NS', 'APCOTEXIND.NS', 'APPLEINDS.NS', 'ARVINDFASN.NS',
-    'ASAHIINDIA.NS', 'ASHIANA.NS', 'ASIANHOTNR.NS', 'ASTRAZEN.NS', 'AUROPHARMA.NS',
-    'AVANTIFEED.NS', 'AXIS.NS', 'BAJAJHLDNG.NS', 'BALAMINES.NS', 'BALMLAWRIE.NS',
-    'BANCOINDIA.NS', 'BASF.NS', 'BAYERCROP.NS', 'BBL.NS', 'BEARDSELL.NS',
-    'BEML.NS', 'BEPL.NS', 'BHARATGEAR.NS', 'BHARATRAS.NS', 'BHEDADEQP.NS',
-    'BHUSANSTL.NS', 'BIKAJI.NS', 'BINDALAGRO.NS', 'BIRLACORPN.NS', 'BLISSGVS.NS',
-    'BLUEDART.NS', 'BLUESTARCO.NS', 'BOMDYEING.NS', 'BORORENEW.NS', 'BRIGADE.NS',
-    'BSE.NS', 'BSOFT.NS', 'CAMPUS.NS', 'CAMS.NS', 'CANFINHOME.NS',
-    'CAPLIPOINT.NS', 'CARBORUNIV.NS', 'CARE.NS', 'CARTRADE.NS', 'CASTROLIND.NS',
-    'CCL.NS', 'CDSL.NS', 'CEATLTD.NS', 'CENTEXT.NS', 'CENTRALBK.NS',
-    'CENTURYPLY.NS', 'CENTURYTEX.NS', 'CERA.NS', 'CHALET.NS', 'CHAMBLFERT.NS',
-    'CHEMPLASTS.NS', 'CHOLAHLDNG.NS', 'CIPLA.NS', 'CLEAN.NS', 'COALINDIA.NS',
-    'COCHIN.NS', 'COLLAR.NS', 'COMPINFO.NS', 'CONCORDBIO.NS', 'CONFIPET.NS',
-    'COROMANDEL.NS', 'COSPOWER.NS', 'COX&KINGS.NS', 'CPSEETEC.NS', 'CRAFTSMAN.NS',
-    'CREDITACC.NS', 'CRISIL.NS', 'CROMPTON.NS', 'CSB.NS', 'CUB.NS',
-    'CUMMINSIND.NS', 'CUPID.NS', 'CYBERMEDIA.NS', 'CYIENT.NS', 'DADRAPHARM.NS',
-    'DALBHARAT.NS', 'DATAPATTNS.NS', 'DCBBANK.NS', 'DCMSHRIRAM.NS', 'DEEPAKFERT.NS',
-    'DEEPAKNTR.NS', 'DELTACORP.NS', 'DESICAL.NS', 'DHANI.NS', 'DHANUKA.NS',
-    'DHARSUGAR.NS', 'DHFL.NS', 'DHUNINV.NS', 'DIAMINESQ.NS', 'DICIND.NS',
-    'DIGISPICE.NS', 'DIVISLAB.NS', 'DIXON.NS', 'DLF.NS', 'DLINKINDIA.NS',
-    'DOLLAR.NS', 'DOVEMARINE.NS', 'DPWIRES.NS', 'DREDGECORP.NS', 'DRREDDY.NS',
-    'DUCON.NS', 'DYCL.NS', 'DYNAMATECH.NS', 'EASEMYTRIP.NS', 'EASTSILK.NS',
-    'ECLERX.NS', 'EDELWEISS.NS', 'EIDPARRY.NS', 'EIHOTEL.NS', 'EKC.NS',
-    'ELGIEQUIP.NS', 'EMAMILTD.NS', 'EMKAY.NS', 'EMMBI.NS', 'ENDURANCE.NS',
-    
-    # Additional stocks (600-900)
-    'ENERGYDEV.NS', 'ENGINERSIN.NS', 'ENTERO.NS', 'EPL.NS', 'EQUITAS.NS',
-    'EQUITASBNK.NS', 'ERIS.NS', 'EROSMEDIA.NS', 'ESCORT.NS', 'ESSDEE.NS',
-    'ESTER.NS', 'EUROTEXIND.NS', 'EVEREADY.NS', 'EXCELINDUS.NS', 'EXIDEIND.NS',
-    'FAIRCHEM.NS', 'FAIRFIN.NS', 'FCL.NS', 'FCONSUMER.NS', 'FDC.NS',
-    'FEDERALBNK.NS', 'FIEMIND.NS', 'FILATEX.NS', 'FINCABLES.NS', 'FINPIPE.NS',
-    'FLAIR.NS', 'FLEXITUFF.NS', 'FLUOROCHEM.NS', 'FMNL.NS', 'FORCEMOT.NS',
-    'FORTISONICS.NS', 'FORTIS.NS', 'FREEDOM.NS', 'FSC.NS', 'FSL.NS',
-    'Gabriel.NS', 'GAEL.NS', 'GAIL.NS', 'GALAXYSURF.NS', 'GALLANTT.NS',
-    'GANDHITUBE.NS', 'GARFIBRES.NS', 'GARNETINT.NS', 'GATEWAY.NS', 'GDL.NS',
-    'GEECEE.NS', 'GENCON.NS', 'GENESYS.NS', 'GESHIP.NS', 'GHCL.NS',
-    'GICHSGFIN.NS', 'GILLANDERS.NS', 'GILLETTE.NS', 'GINNIFILA.NS', 'GIPCL.NS',
-    'GKBOPTICAL.NS', 'GKW.NS', 'GLAXO.NS', 'GLENMARK.NS', 'GLOBAL.NS',
-    'GLOBALPET.NS', 'GLOBE.NS', 'GLOBUSSPR.NS', 'GMBREW.NS', 'GMDCLTD.NS',
-    'GMMPFAUDLR.NS', 'GMRINFRA.NS', 'GNFC.NS', 'GOACARBON.NS', 'GOCLCORP.NS',
-    'GODFRYPHLP.NS', 'GODREJAGRO.NS', 'GODREJCP.NS', 'GODREJIND.NS', 'GODREJPROP.NS',
-    'GOKEX.NS', 'GOKUL.NS', 'GOLD.NS', 'GOODLUCK.NS', 'GOODYEAR.NS',
-    'GPIL.NS', 'GPPL.NS', 'GRANULES.NS', 'GRAPHITE.NS', 'GRASIM.NS',
-    'GREAVESCOT.NS', 'GREENLAM.NS', 'GREENPANEL.NS', 'GREENPLY.NS', 'GRINDWELL.NS',
-    'GRSE.NS', 'GRUH.NS', 'GSFC.NS', 'GSHIP.NS', 'GSS.NS',
-    'GTLINFRA.NS', 'GTL.NS', 'GTPL.NS', 'GUFICBIO.NS', 'GUJALKALI.NS',
-    'GUJAPOLLO.NS', 'GUJGAS.NS', 'GUJGASLTD.NS', 'GULFOILLUB.NS', 'GULFPETRO.NS',
-    'GVKPIL.NS', 'HAL.NS', 'HAPPSTMNDS.NS', 'HATHWAY.NS', 'HAVELLS.NS',
-    'HCC.NS', 'HCG.NS', 'HCLINFOSYS.NS', 'HCLTECH.NS', 'HCL-INSYS.NS',
-    'HDFC.NS', 'HDFCAMC.NS', 'HDFCBANK.NS', 'HDFCLIFE.NS', 'HEG.NS',
-    'HEIDELBERG.NS', 'HERANBA.NS', 'HERCULES.NS', 'HERITGFOOD.NS', 'HEROMOTOCO.NS',
-    'HESTERBIO.NS', 'HEXAWARE.NS', 'HFCL.NS', 'HGINFRA.NS', 'HIKAL.NS',
-    'HIL.NS', 'HIMATSEIDE.NS', 'HINDALCO.NS', 'HINDCOMPOS.NS', 'HINDCOPPER.NS',
-    'HINDDORROL.NS', 'HINDMOTOR.NS', 'HINDNATGLS.NS', 'HINDOILEXP.NS', 'HINDPETRO.NS',
-    'HINDSANGAM.NS', 'HINDTANAC.NS', 'HINDUNILVR.NS', 'HINDWARE.NS', 'HINDZINC.NS',
-    'HINDSYN.NS', 'HIRECT.NS', 'HISARMETAL.NS', 'HITECH.NS', 'HITECHCORP.NS',
-    
-    # Additional stocks (900-1200)
-    'HITECHGEAR.NS', 'HMT.NS', 'HMVL.NS', 'HNDFDS.NS', 'HONAUT.NS',
-    'HONEY.NS', 'HOTELEELA.NS', 'HOVS.NS', 'HPL.NS', 'HSCL.NS',
-    'HTMEDIA.NS', 'HUBTOWN.NS', 'HUHTAMAKI.NS', 'HYDRAB.NS', 'HYSTEEL.NS',
-    'IAF.NS', 'IBREALEST.NS', 'IBULHSGFIN.NS', 'ICEMAKE.NS', 'ICICIBANK.NS',
-    'ICICIBANKP.NS', 'ICICIBIO.NS', 'ICICICARFIN.NS', 'ICICIGI.NS', 'ICICIM.NS',
-    'ICICIMF.NS', 'ICICIPRUD.NS', 'ICICIPRU.NS', 'ICICIPRULI.NS', 'ICIL.NS',
-    'ICRA.NS', 'ICRACD.NS', 'ICSA.NS', 'IDEA.NS', 'IDEAFORGE.NS',
-    'IDFC.NS', 'IDFCBANK.NS', 'IDFCFIRSTB.NS', 'IDFCLIM.NS', 'IDFCMF.NS',
-    'IDFNL.NS', 'IDFSECURITIES.NS', 'IDNTHSUG.NS', 'IEX.NS', 'IFBAGRO.NS',
-    'IFBIND.NS', 'IFCI.NS', 'IFGL.NS', 'IFGLEXP.NS', 'IFL.NS',
-    'IGARASHI.NS', 'IGL.NS', 'IGPL.NS', 'IIB.NS', 'IIFL.NS',
-    'IIFLSEC.NS', 'IIFLW.NS', 'IIHFL.NS', 'IITL.NS', 'IL&FSENGG.NS',
-    'IL&FSTR.NS', 'IL&FSTHQ.NS', 'IL&FSWLTD.NS', 'IMAGICAA.NS', 'IMFA.NS',
-    'IMPAL.NS', 'IMPEXFERRO.NS', 'INDBANK.NS', 'INDHOTEL.NS', 'INDIACEM.NS',
-    'INDIAGLYCO.NS', 'INDIAGRID.NS', 'INDIANB.NS', 'INDIANCARD.NS', 'INDIANHUME.NS',
-    'INDIAMART.NS', 'INDIGO.NS', 'INDIGOPNTS.NS', 'INDLMETER.NS', 'INDNIPPON.NS',
-    'INDOCO.NS', 'INDOCOUNT.NS', 'INDORAMA.NS', 'INDOSTAR.NS', 'INDOTECH.NS',
-    'INDOTHAI.NS', 'INDOWIND.NS', 'INDRAMEDCO.NS', 'INDSWFTLAB.NS', 'INDSWFTLTD.NS',
-    'INDUSFILA.NS', 'INDUSINDBK.NS', 'INDUSTOWER.NS', 'INEOS.NS', 'INFIBEAM.NS',
-    'INFINITY.NS', 'INFOBEAN.NS', 'INFOMEDIA.NS', 'INFOTECH.NS', 'INFRA.NS',
-    'INFRATEL.NS', 'INFY.NS', 'INGVYSYABK.NS', 'INNOIND.NS', 'INNOVANA.NS',
-    'INSECTICID.NS', 'INSPIRISYS.NS', 'INTELLECT.NS', 'INTENTECH.NS', 'INTLCONV.NS',
-    'INDBANK.NS', 'INVENTURE.NS', 'IOB.NS', 'IOC.NS', 'IOLCP.NS',
-    'IPA.NS', 'IPCALAB.NS', 'IPL.NS', 'IRB.NS', 'IRCON.NS',
-    'IRCTC.NS', 'IREDA.NS', 'IRFC.NS', 'ISGEC.NS', 'ISMTLTD.NS',
-    'ITC.NS', 'ITDC.NS', 'ITDCEM.NS', 'ITI.NS', 'IVP.NS',
-    'IZMO.NS' , 'J&&KBANK.NS', 'JAGRAN.NS', 'JAGSNPHARM.NS', 'JAIBALAJI.NS',
-    'JAICORPLTD.NS', 'JAMNAAUTO.NS', 'JAYAGROGN.NS', 'JAYBARMARU.NS', 'JAYNECOIND.NS',
-    'JAYPRAKASH.NS', 'JAYSREETEA.NS', 'JBCHEPHARM.NS', 'JBFIND.NS', 'JBMA.NS',
-    'JHS.NS', 'JISLDVREQS.NS', 'JISLJALEQS.NS', 'JKCEMENT.NS', 'JKIL.NS',
-    'JKLAKSHMI.NS', 'JKPAPER.NS', 'JKTYRE.NS', 'JMA.NS', 'JMFINANCIL.NS',
-    'JMTAUTOLTD.NS', 'JOCIL.NS', 'JPASSOCIAT.NS', 'JPINFRATEC.NS', 'JPOLYINVST.NS',
-    'JPPOWER.NS', 'JSLHISAR.NS', 'JSL.NS', 'JSWENERGY.NS', 'JSWHL.NS',
-    'JSWSTEEL.NS', 'JUBILANT.NS', 'JUBLFOOD.NS', 'JUBLINDS.NS', 'JUSTDIAL.NS',
-    # Remaining stocks (1200-1500)
-'JYOTHYLAB.NS', 'JYOTISTRUC.NS', 'KABRAEXTRU.NS', 'KAJARIACER.NS', 'KAKATCEM.NS',
-'KAKATIND.NS', 'KALAMANDIR.NS', 'KALYANI.NS', 'KALYANIFRG.NS', 'KALYANKJIL.NS',
-'KAMATHOTEL.NS', 'KAMDHENU.NS', 'KANANIIND.NS', 'KANORICHEM.NS', 'KANSAINER.NS',
-'KANSAIFC.NS', 'KANSAINER.NS', 'KAPILSOL.NS', 'KARDA.NS', 'KARURVYSYA.NS',
-'KASBMINI.NS', 'KATAREHOSG.NS', 'KAVVERITEL.NS', 'KAYA.NS', 'KDDL.NS',
-'KEC.NS', 'KEI.NS', 'KELLTONTEC.NS', 'KERNEX.NS', 'KESORAMIND.NS',
-'KEYFINSERV.NS', 'KFINTECH.NS', 'KHADIM.NS', 'KILITCH.NS', 'KINGFA.NS',
-'KIRIINDUS.NS', 'KIRLOSBROS.NS', 'KIRLOSENG.NS', 'KIRLOSIND.NS', 'KIRLPNU.NS',
-'KITEX.NS', 'KKCL.NS', 'KMF.NS', 'KNRCON.NS', 'KOKUYOCMLN.NS',
-'KOLTEPATIL.NS', 'KOPRAN.NS', 'KOSOFE.NS', 'KOTAKAGIA.NS', 'KOTAKBANK.NS',
-'KOTAKBKETF.NS', 'KOTAKINFIA.NS', 'KOTAKMAH.NS', 'KOTAKMFIX.NS', 'KOTAKNIFTY.NS',
-'KOTAKPSUBK.NS', 'KOTARISUG.NS', 'KPIL.NS', 'KPITTECH.NS', 'KPRMILL.NS',
-'KRBL.NS', 'KREBSBIO.NS', 'KRIDHANINF.NS', 'KRISHANA.NS', 'KRISHCA.NS',
-'KRISHIVAL.NS', 'KRITIKA.NS', 'KSB.NS', 'KSE.NS', 'KSL.NS',
-'KTKBANK.NS', 'L&T.NS', 'L&TFH.NS', 'LALPATHLAB.NS', 'LAMBODHARA.NS',
-'LANDMARK.NS', 'LAOPALA.NS', 'LASA.NS', 'LAURUSLABS.NS', 'LAXMIMACH.NS',
-'LCCINFOTEC.NS', 'LEMONTREE.NS', 'LGBBROSLTD.NS', 'LIBERTSHOE.NS', 'LICHSGFIN.NS',
-'LINCOLN.NS', 'LINDEINDIA.NS', 'LLOYDSME.NS', 'LLOYDSTEEL.NS', 'LMTL.NS',
-'LOTUSEYE.NS', 'LOVABLE.NS', 'LOWVOLMOM.NS', 'LT.NS', 'LTFOODS.NS',
-'LTIM.NS', 'LTTS.NS', 'LUMAXIND.NS', 'LUMAXTECH.NS', 'LUPIN.NS',
-'LUPINCHEM.NS', 'LUXIND.NS', 'LXCHEM.NS', 'LYKALABS.NS', 'M&M.NS',
-'M&MFIN.NS', 'MAANALU.NS', 'MACPOWER.NS', 'MADHAV.NS', 'MADHUCON.NS',
-'MADRASFERT.NS', 'MAGADSUGAR.NS', 'MAGMA.NS', 'MAGNUM.NS', 'MAHAPEXLTD.NS',
-'MAHABANK.NS', 'MAHASTEEL.NS', 'MAHESWAR.NS', 'MAHINDCIE.NS', 'MAHLIFE.NS',
-'MAHLOG.NS', 'MAHSCOOTER.NS', 'MAHSEAMLES.NS', 'MAITHANALL.NS', 'MAJESCO.NS',
-'MAKEINDIA.NS', 'MAKSON.NS', 'MANAKALUCO.NS', 'MANAKCOAT.NS', 'MANAKSIA.NS',
-'MANAKSTEEL.NS', 'MANALIPETC.NS', 'MANAPPURAM.NS', 'MANGALAM.NS', 'MANGCHEFER.NS',
-'MANINDS.NS', 'MANINFRA.NS', 'MANKIND.NS', 'MANUGRAPH.NS', 'MAPFCDL.NS',
-'MARALOVER.NS', 'MARATHON.NS', 'MARICO.NS', 'MARINE.NS', 'MARKSANS.NS',
-'MARSHALL.NS', 'MARUTI.NS', 'MASFIN.NS', 'MASTEK.NS', 'MATRIMONY.NS',
-'MAWANASUG.NS', 'MAXHEALTH.NS', 'MAXINDIA.NS', 'MAXVIL.NS', 'MAYURUNIQ.NS',
-'MAZDA.NS', 'MBAPL.NS', 'MBECL.NS', 'MCDOWELL-N.NS', 'MCDHOLDING.NS',
-'MCL.NS', 'MCLEODRUSS.NS', 'MCX.NS', 'MEADOW.NS', 'MEERA.NS',
-'MEG.NS', 'MEGASOFT.NS', 'MEGHMANI.NS', 'MELSTAR.NS', 'MENTHANOL.NS',
-'MERCATOR.NS', 'MERCK.NS', 'METALFORGE.NS', 'METROBRAND.NS', 'METROPOLIS.NS',
-'MFSL.NS', 'MGL.NS', 'MHRIL.NS', 'MICEL.NS', 'MICROPRO.NS',
-'MIDDAY.NS', 'MIDHANI.NS', 'MINDACORP.NS', 'MINDTECK.NS', 'MINDTREE.NS',
-'MIRCELECTR.NS', 'MIRZAINT.NS', 'MITCON.NS', 'MITTAL.NS', 'MKPL.NS',
-'MMP.NS', 'MMTC.NS', 'MODIPON.NS', 'MODISOLEZ.NS', 'MODIRUBBER.NS',
-'MODTHREAD.NS', 'MOHEALTH.NS', 'MOHITIND.NS', 'MOHOTAIND.NS', 'MOLDTKPAC.NS',
-'MOLDTECH.NS', 'MON100.NS', 'MONARCH.NS', 'MORGANITE.NS', 'MOTHERSON.NS',
-'MOTILALOFS.NS', 'MOTILALOSL.NS', 'MOXSH.NS', 'MPHASIS.NS', 'MPSLTD.NS',
-'MRF.NS', 'MRO-TEK.NS', 'MRPL.NS', 'MSP.NS', 'MSTCLTD.NS',
-'MTEDUCARE.NS', 'MTARTECH.NS', 'MUKANDLTD.NS', 'MUKTA.NS', 'MUKTAARTS.NS',
-'MULTIBASE.NS', 'MULTILOGIC.NS', 'MULTALS.NS', 'MUNDRAPORT.NS', 'MURUDCERA.NS',
-'MUTHOOTCAP.NS', 'MUTHOOTFIN.NS', 'MVGJL.NS', 'NAC.NS', 'NAGAFERT.NS',
-'NAGAIND.NS', 'NAGREEKCAP.NS', 'NAHARCAP.NS', 'NAHAREXP.NS', 'NAHARPOLY.NS',
-'NAHARSPING.NS', 'NAINCO.NS', 'NANDAN.NS', 'NARMADA.NS', 'NASPERS.NS',
-'NATCOPHARM.NS', 'NATHBIOGEN.NS', 'NATIONALUM.NS', 'NAUKRI.NS', 'NAVALITD.NS',
-'NAVINFLUOR.NS', 'NAVKARCORP.NS', 'NAVNETEDUL.NS', 'NBCC.NS', 'NBIFIN.NS',
-'NBVENTURES.NS', 'NBWM.NS', 'NCC.NS', 'NCLIND.NS', 'NDGL.NS'
-]
-# ============================================
+# Configure logging (queued + rotating, LOG_LEVEL=WARNING for production)
+log_setup.setup_logging('data_fetch.log')
 
-DB_PATH = 'nifty50_top20.db'
 BATCH_SIZE = 500  # Process 500 stocks per batch
 
-def create_database():
+def create_database(db_path, price_encoding=None):
     """Create database table"""
-    conn = sqlite3.connect(DB_PATH)
-    cursor = conn.cursor()
-    
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS stock_1min_data (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            symbol TEXT NOT NULL,
-            date DATE NOT NULL,
-            open REAL,
-            high REAL,
-            low REAL,
-            close REAL,
-            volume INTEGER,
-            fetched_at DATE DEFAULT CURRENT_STAMP,
-            UNIQUE(symbol, datetime)
-        )
-    ''')
-    
-    cursor.execute('''
-        CREATE INDEX IF NOT EXISTS idx_symbol_datetime 
-        ON stock_1min_data(symbol, datetime)
-    ''')
-    
-    conn.commit()
-    conn.close()
+    ingest.create_database(db_path, price_encoding)
 
-def fetch_batch(batch_stocks, batch_num):
-    """Fetch 1-minute data for a batch of stocks"""
+def fetch_batch(batch_stocks, batch_num, window=None, interval='1m'):
+    """Fetch 1-minute data for a batch of stocks (clamped to the session window if given)"""
     try:
         logging.info(f"📊 Batch {batch_num}: Fetching {len(batch_stocks)} stocks...")
         start_time = time.time()
         
+        span = {'start': window[0], 'end': window[1]} if window else {'period': '1d'}
         data = yf.download(
             tickers=batch_stocks,
-            period='1d',
-            interval='1m',
+            **span,
+            interval=interval,
             group_by='ticker',
             threads=True,
             progress=False,
@@ -334,67 +67,29 @@ def fetch_batch(batch_stocks, batch_num):
         logging.error(f"❌ Batch {batch_num} failed: {str(e)}")
         return None
 
-def store_data(data, stock_list, batch_num):
-    """Store 1-minute data"""
+def store_data(data, stock_list, batch_num, db_path, cycle=None, traded=()):
+    """Store 1-minute data (and journal the batch for resume if a cycle is given)"""
     if data is None or data.empty:
         logging.warning(f"⚠️ Batch {batch_num}: No data to store")
         return 0, 0
     
-    conn = sqlite3.connect(DB_PATH)
-    cursor = conn.cursor()
-    total_candles = 0
-    stocks_processed = 0
-    
+    conn = ingest.connect(db_path)
     try:
-        for symbol in stock_list:
-            try:
-                if len(stock_list) == 1:
-                    stock_data = data
-                else:
-                    stock_data = data[symbol]
-                
-                if stock_data.empty:
-                    continue
-                
-                for idx, row in stock_data.iterrows():
-                    try:
-                        if pd.isna(row['Close']):
-                            continue
-                        
-                        cursor.execute('''
-                            INSERT OR REPLACE INTO stock_1min_data 
-                            (symbol, datetime, open, high, low, close, volume)
-                            VALUES (?, ?, ?, ?, ?, ?, ?)
-                        ''', (
-                            symbol,
-                            idx.strftime('%Y-%m-%d %H:%M:%S'),
-                            float(row['Open']) if pd.notna(row['Open']) else None,
-                            float(row['High']) if pd.notna(row['High']) else None,
-                            float(row['Low']) if pd.notna(row['Low']) else None,
-                            float(row['Close']) if pd.notna(row['Close']) else None,
-                            int(row['Volume']) if pd.notna(row['Volume']) else 0
-                        ))
-                        total_candles += 1
-                        
-                    except:
-                        continue
-                
-                stocks_processed += 1
-                    
-            except Exception as e:
-                continue
-        
+        total_candles, stocks_processed = ingest.store_frame(conn, data, stock_list)
+        if cycle is not None:
+            # Same transaction as the candles - a killed run loses both or neither
+            journal.record(conn, cycle, stock_list, traded, datetime.now(timezone.utc))
         conn.commit()
-        logging.info(f"💾 Batch {batch_num}: Stored {total_candles:,} candles from {stocks_processed}/{len(stock_list)} stocks")
+        logging.info(f"💾 Batch {batch_num}: Stored {total_candles:,} candles from {stocks_processed}/{len(stock_list)} stocks → {db_path}")
         
     finally:
         conn.close()
     
     return total_candles, stocks_processed
 
-def get_stats():
+def get_stats(db_path):
     """Get database statistics"""
-    conn = sqlite3.connect(DB_PATH)
+    conn = sqlite3.connect(db_path)
     cursor = conn.cursor()
     
     cursor.execute('SELECT COUNT(*) FROM stock_1min_data')
@@ -410,69 +105,183 @@ def get_stats():
     
     return total, stocks, latest
 
-def main():
+def profile_targets(stages):
+    """(label, owner, attribute) to wrap for each --profile stage ([] = whole cycle)"""
+    if not stages or 'cycle' in stages:
+        return []
+    module = sys.modules[__name__]
+    targets = {
+        'fetch': (module, 'fetch_batch'),
+        'download': (yf, 'download'),
+        'store': (module, 'store_data'),
+        'screener': (screener, 'run'),
+        'snapshot': (snapshot, 'publish'),
+        'alerts': (alerts, 'run'),
+        'correlation': (correlation, 'run'),
+    }
+    return [(stage,) + targets[stage] for stage in stages]
+
+def main(only=None):
     """Main execution with batch processing"""
+    if not market_calendar.should_run():
+        logging.info(f"💤 Market closed ({market_calendar.now_ist():%Y-%m-%d %H:%M} IST) - skipping run")
+        return
+    window = market_calendar.fetch_window()
+    now = datetime.now(timezone.utc)
+    
+    due = profiles.due_profiles(now, only)
+    if not due:
+        logging.info("💤 No profile due this tick")
+        return
+    
+    for profile in due:
+        create_database(profile.db_path, profile.price_encoding)
+    
+    # Resume unfinished cycles: only symbols not committed yet (see journal.py)
+    # Stale journals (earlier session, or older than one schedule period) are dropped
+    cycles = {p.name: journal.open_cycle(p.db_path, p.name, now, profiles.previous_fire(p.schedule, now))
+              for p in due}
+    members = {p.name: set(profiles.fetched_symbols(p)) - cycles[p.name].done for p in due}
+    
+    # Fetch every distinct symbol once per interval, fan out to each profile; stalest first
+    day = journal.session_day(now)
+    last_seen = {}
+    for p in due:
+        committed = journal.last_commits(p.db_path, p.name, day)
+        for symbol in members[p.name]:
+            last_seen[symbol] = min(last_seen.get(symbol, float('inf')), committed.get(symbol, 0))
+    stock_list = journal.rotate([s for s in profiles.union_universe(due) if s in last_seen], last_seen)
+    requested = sum(profiles.upstream_requests([s for s in profiles.fetched_symbols(p) if s in members[p.name]],
+                                               BATCH_SIZE)
+                    for p in due)
+    intervals = sorted({p.interval for p in due})
+    
     logging.info("="*70)
     logging.info(f"🚀 GitHub Actions - Stock Fetcher (BATCH MODE)")
     logging.info(f"⏰ Run Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    logging.info(f"📦 Total Stocks: {len(STOCK_LIST)}")
+    logging.info(f"🗂️ Profiles: {', '.join(p.name for p in due)}")
+    logging.info(f"📦 Total Stocks: {len(stock_list)} distinct ({requested} requested by profiles)")
     logging.info(f"📊 Batch Size: {BATCH_SIZE}")
-    logging.info(f"🔢 Number of Batches: {(len(STOCK_LIST) + BATCH_SIZE - 1) // BATCH_SIZE}")
+    logging.info(f"🔢 Number of Batches: {len(intervals) * ((len(stock_list) + BATCH_SIZE - 1) // BATCH_SIZE)}")
+    for p in due:
+        if cycles[p.name].done:
+            logging.info(f"⏯️ {p.name}: resuming cycle from {cycles[p.name].started} - "
+                         f"{len(cycles[p.name].done)} symbols already committed, {len(members[p.name])} left")
     logging.info("="*70)
     
-    create_database()
+    # Alert rules compiled once per run (None = profile has no rules)
+    rulebooks = {p.name: alerts.load(p.db_path) for p in due}
     
-    total_candles_all = 0
-    total_stocks_all = 0
+    # Rolling correlation state from the last stored minutes (each run is a fresh process)
+    trackers = {p.name: correlation.warm_start(p.db_path, p.universe) for p in due if not cycles[p.name].done}
     
-    # Split into batches and process
-    num_batches = (len(STOCK_LIST) + BATCH_SIZE - 1) // BATCH_SIZE
+    totals = {p.name: [0, 0] for p in due}
+    panels = {p.name: [] for p in due}
+    fetched_bytes = 0
+    fetched_symbols = 0
     
-    for i in range(num_batches):
-        batch_num = i + 1
-        start_idx = i * BATCH_SIZE
-        end_idx = min((i + 1) * BATCH_SIZE, len(STOCK_LIST))
-        batch_stocks = STOCK_LIST[start_idx:end_idx]
-        
-        logging.info(f"\n{'='*70}")
-        logging.info(f"🔄 Processing Batch {batch_num}/{num_batches}")
-        logging.info(f"📋 Stocks {start_idx+1} to {end_idx} ({len(batch_stocks)} stocks)")
-        logging.info(f"{'='*70}")
-        
-        # Fetch batch
-        data = fetch_batch(batch_stocks, batch_num)
-        
-        # Store batch
-        if data is not None:
-            candles, stocks = store_data(data, batch_stocks, batch_num)
-            total_candles_all += candles
-            total_stocks_all += stocks
+    # Split into batches (per interval) and process
+    for interval in intervals:
+        targets = [p for p in due if p.interval == interval]
+        interval_stocks = [s for s in stock_list if any(s in members[p.name] for p in targets)]
+        num_batches = (len(interval_stocks) + BATCH_SIZE - 1) // BATCH_SIZE
         
-        # Small delay between batches
-       #if i < num_batches - 1:
-        #    logging.info(f"⏳ Waiting 2 seconds before next batch...")
-         #   time.sleep(2)
-
-    # Small delay between batches
-     # if i < num_batches - 1:
-      #      logging.info(f"⏳ Waiting 2 seconds before next batch...")
-       #     time.sleep(2)
+        for i in range(num_batches):
+            batch_num = i + 1
+            start_idx = i * BATCH_SIZE
+            end_idx = min((i + 1) * BATCH_SIZE, len(interval_stocks))
+            batch_stocks = interval_stocks[start_idx:end_idx]
+            
+            logging.info(f"\n{'='*70}")
+            logging.info(f"🔄 Processing Batch {batch_num}/{num_batches} ({interval})")
+            logging.info(f"📋 Stocks {start_idx+1} to {end_idx} ({len(batch_stocks)} stocks)")
+            logging.info(f"{'='*70}")
+            
+            # Fetch batch
+            data = fetch_batch(batch_stocks, batch_num, window, interval)
+            if data is None:
+                continue
+            fetched_bytes += int(data.memory_usage(index=False).sum())
+            fetched_symbols += len(batch_stocks)
+            batch_panel = screener.to_panel(data, batch_stocks)
+            
+            # Store batch into every profile that wants these symbols
+            for profile in targets:
+                subset = [s for s in batch_stocks if s in members[profile.name]]
+                if not subset:
+                    continue
+                subset_panel = screener.select(batch_panel, subset)
+                candles, stocks = store_data(data, subset, batch_num, profile.db_path,
+                                             cycles[profile.name], journal.traded_symbols(subset_panel))
+                totals[profile.name][0] += candles
+                totals[profile.name][1] += stocks
+                panels[profile.name].append(subset_panel)
+                
+                # Alerts on the bars just stored
+                if rulebooks[profile.name] and candles:
+                    book, since = rulebooks[profile.name]
+                    alerts.run(book, subset_panel, profile.db_path, since)
     
-    # Final statistics
-    total, unique_stocks, latest = get_stats()
+    # One line for all per-symbol download errors of this run
+    log_setup.flush_failures()
     
-    logging.info(f"\n{'='*70}")
-    logging.info(f"📊 FINAL DATABASE STATS:")
-    logging.info(f"{'='*70}")
-    logging.info(f"   Total Candles in DB: {total:,}")
-    logging.info(f"   Unique Stocks in DB: {unique_stocks}")
-    logging.info(f"   Latest Data: {latest}")
-    logging.info(f"   This Run: {total_candles_all:,} candles from {total_stocks_all} stocks")
+    saved = requested - len(stock_list)
+    if saved > 0 and fetched_symbols:
+        saved_mb = saved * fetched_bytes / fetched_symbols / (1024 * 1024)
+        logging.info(f"♻️ Shared fetch: {len(stock_list)} symbols instead of {requested} "
+                     f"({saved} requests, ~{saved_mb:.1f} MB decoded data saved)")
     
-    db_size = os.path.getsize(DB_PATH) / (1024 * 1024)
-    logging.info(f"   Database Size: {db_size:.2f} MB")
-    logging.info(f"{'='*70}")
+    for profile in due:
+        # A resumed cycle only holds the remaining symbols - keep the README / snapshot of the full universe
+        resumed = bool(cycles[profile.name].done)
+        
+        # Whole-universe screener over the latest minute (the benchmark index is not ranked)
+        panel = screener.merge_panels(panels[profile.name])
+        stocks = None if panel is None else screener.select(panel, [s for s in panel[1] if s != profiles.BENCHMARK])
+        screener.run(stocks, profile.db_path, None if resumed else profile.readme_path)
+        
+        # Latest bar per symbol for local readers (see snapshot.py)
+        if profile.snapshot_path and not resumed:
+            snapshot.publish(profile.snapshot_path, panel, profile.universe)
+        
+        # Correlation / beta from the minutes just stored (a resumed cycle lacks part of the universe)
+        if panel is not None and profile.name in trackers:
+            correlation.run(trackers[profile.name], panel, profile.db_path)
+        
+        if rulebooks[profile.name]:
+            alerts.advance(profile.db_path, panel)
+        journal.close_cycle(profile.db_path, profile.name)
+        profiles.mark_run(profile, now)
+        
+        # Final statistics
+        total, unique_stocks, latest = get_stats(profile.db_path)
+        candles_run, stocks_run = totals[profile.name]
+        
+        logging.info(f"\n{'='*70}")
+        logging.info(f"📊 FINAL DATABASE STATS ({profile.name}):")
+        logging.info(f"{'='*70}")
+        logging.info(f"   Total Candles in DB: {total:,}")
+        logging.info(f"   Unique Stocks in DB: {unique_stocks}")
+        logging.info(f"   Latest Data: {latest}")
+        logging.info(f"   This Run: {candles_run:,} candles from {stocks_run} stocks")
+        
+        db_size = os.path.getsize(profile.db_path) / (1024 * 1024)
+        logging.info(f"   Database Size: {db_size:.2f} MB")
+        logging.info(f"{'='*70}")
     logging.info("\n✅ Batch processing completed successfully!")
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description='Fetch 1-minute candles for all due profiles')
+    parser.add_argument('--only', nargs='+', choices=sorted(profiles.PROFILES),
+                        help='run these profiles now, ignoring their schedules')
+    parser.add_argument('--profile', nargs='*', metavar='STAGE',
+                        choices=['cycle', 'fetch', 'download', 'store', 'screener', 'snapshot', 'alerts', 'correlation'],
+                        help='profile the whole cycle, or only these stages (see profiling.py)')
+    parser.add_argument('--profile-top', type=int, default=40, help='functions in the text report')
+    args = parser.parse_args()
+    
+    if args.profile is None:
+        main(args.only)
+    else:
+        import profiling
+        profiling.profile_call('data_fetch', main, (args.only,), profile_targets(args.profile), args.profile_top)
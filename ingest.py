@@ -0,0 +1,233 @@
+import sqlite3
+from itertools import islice, repeat
+import numpy as np
+import pandas as pd
+
+"""
+Shared ingest path - schema + bulk writes
+Used by the minute fetchers and the historical backfill
+"""
+
+MINUTE_TABLE = 'stock_1min_data'
+BARS_TABLE = 'stock_bars'  # Coarser intervals (5m, 1h, 1d) from backfill
+MINUTE_VIEW = 'stock_1min_prices'  # Decoded views - what readers should query
+BARS_VIEW = 'stock_bars_prices'
+PRICE_SCALES = {'paise': 100}  # Optional fixed-point encodings: units per rupee
+
+def connect(db_path):
+    """Open a connection tuned for bulk writes"""
+    conn = sqlite3.connect(db_path, timeout=30)
+    conn.execute('PRAGMA journal_mode=WAL')
+    conn.execute('PRAGMA synchronous=NORMAL')
+    return conn
+
+def create_database(db_path, price_encoding=None):
+    """Create data tables; price_encoding='paise' stores OHLC as integer paise (new DBs only)"""
+    conn = sqlite3.connect(db_path)
+    cursor = conn.cursor()
+
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS db_meta (
+            key TEXT PRIMARY KEY,
+            value TEXT
+        )
+    ''')
+    is_new = cursor.execute(
+        "SELECT COUNT(*) FROM sqlite_master WHERE type = 'table' AND name = ?", (MINUTE_TABLE,)).fetchone()[0] == 0
+    if is_new and price_encoding:
+        if price_encoding not in PRICE_SCALES:
+            raise ValueError(f"Unknown price encoding: {price_encoding}")
+        cursor.execute("INSERT OR REPLACE INTO db_meta (key, value) VALUES ('price_encoding', ?)", (price_encoding,))
+    # INTEGER affinity keeps encoded prices as integers and off-grid fallbacks as REAL
+    price_type = 'INTEGER' if get_price_encoding(conn) else 'REAL'
+
+    cursor.execute(f'''
+        CREATE TABLE IF NOT EXISTS {MINUTE_TABLE} (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            symbol TEXT NOT NULL,
+            datetime DATETIME NOT NULL,
+            open {price_type},
+            high {price_type},
+            low {price_type},
+            close {price_type},
+            volume INTEGER,
+            fetched_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+            UNIQUE(symbol, datetime)
+        )
+    ''')
+
+    cursor.execute(f'''
+        CREATE TABLE IF NOT EXISTS {BARS_TABLE} (
+            symbol TEXT NOT NULL,
+            interval TEXT NOT NULL,
+            datetime DATETIME NOT NULL,
+            open {price_type},
+            high {price_type},
+            low {price_type},
+            close {price_type},
+            volume INTEGER,
+            fetched_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+            PRIMARY KEY (symbol, interval, datetime)
+        )
+    ''')
+
+    # Readers query these views and always get rupees back
+    scale = PRICE_SCALES.get(get_price_encoding(conn), 1)
+    decoded = ', '.join(
+        f"CASE WHEN typeof({col}) = 'integer' THEN {col} / {scale:.1f} ELSE {col} END AS {col}"
+        for col in ('open', 'high', 'low', 'close'))
+    cursor.execute(f'''
+        CREATE VIEW IF NOT EXISTS {MINUTE_VIEW} AS
+        SELECT id, symbol, datetime, {decoded}, volume, fetched_at FROM {MINUTE_TABLE}
+    ''')
+    cursor.execute(f'''
+        CREATE VIEW IF NOT EXISTS {BARS_VIEW} AS
+        SELECT symbol, interval, datetime, {decoded}, volume, fetched_at FROM {BARS_TABLE}
+    ''')
+
+    conn.commit()
+    conn.close()
+
+def get_price_encoding(conn):
+    """Encoding recorded when the DB was created (None = float REAL prices)"""
+    try:
+        row = conn.execute("SELECT value FROM db_meta WHERE key = 'price_encoding'").fetchone()
+    except sqlite3.OperationalError:
+        return None
+    return row[0] if row else None
+
+def _on_grid(values, scale):
+    """(integer units, mask of prices whose float32 round trip through the grid is exact)"""
+    nan = np.isnan(values)
+    scaled = np.rint(np.where(nan, 0, values) * scale)
+    # Yahoo prices are float32-derived: 990.9000244140625 is 990.90 on the grid
+    return scaled, ((scaled / scale).astype(np.float32) == values.astype(np.float32)) & ~nan
+
+def encode_prices(values, scale):
+    """Prices -> integer units where the round trip is exact, raw floats (off-grid) otherwise"""
+    scaled, on_grid = _on_grid(values, scale)
+    units = scaled.astype(np.int64)
+    if on_grid.all():
+        return units.tolist()
+    mixed = units.astype(object)
+    off = ~on_grid
+    mixed[off] = np.where(np.isnan(values[off]), None, values[off].astype(object))
+    return mixed.tolist()
+
+def snap_prices(values, scale=PRICE_SCALES['paise']):
+    """Float prices with float32 noise removed (990.9000244140625 -> 990.9), off-grid kept as is"""
+    scaled, on_grid = _on_grid(values, scale)
+    return np.where(on_grid, scaled / scale, values)
+
+def decode_price(value, encoding):
+    """Inverse of encode_prices for a single stored value"""
+    if encoding and isinstance(value, int):
+        return value / PRICE_SCALES[encoding]
+    return value
+
+PRICE_FIELDS = ('Open', 'High', 'Low', 'Close')
+CHUNK_ROWS = 10000  # Rows per executemany when streaming a frame
+
+def symbol_columns(data, symbol, symbols):
+    """Positional column indexes of one symbol's OHLCV in a yf.download result"""
+    columns = data.columns
+    if isinstance(columns, pd.MultiIndex):
+        keys = [(symbol, field) for field in PRICE_FIELDS + ('Volume',)]
+    elif len(symbols) == 1:
+        keys = list(PRICE_FIELDS + ('Volume',))
+    else:
+        return None
+    try:
+        return [columns.get_loc(key) for key in keys]
+    except KeyError:
+        return None
+
+def _to_list(values):
+    """ndarray -> list of Python numbers with NaN as None"""
+    out = values.tolist()
+    if values.dtype.kind == 'f' and np.isnan(values).any():
+        out = [None if x != x else x for x in out]
+    return out
+
+def iter_symbol_arrays(data, symbols):
+    """Yield (symbol, keep mask, [o, h, l, c, v]) column by column, without slicing data[symbol]"""
+    for symbol in symbols:
+        positions = symbol_columns(data, symbol, symbols)
+        if positions is None:
+            continue
+
+        # iloc on a single column is a view into the frame's block
+        columns = [data.iloc[:, pos].to_numpy() for pos in positions]
+        keep = ~np.isnan(columns[3])
+        if not keep.any():
+            continue
+        yield symbol, keep, columns
+
+def frame_to_rows(data, symbols, price_scale=None):
+    """Yield (symbol, datetime, open, high, low, close, volume) rows, skipping empty closes"""
+    # All symbols share the download index - format timestamps once
+    stamps = data.index.strftime('%Y-%m-%d %H:%M:%S').to_numpy()
+
+    for symbol, keep, columns in iter_symbol_arrays(data, symbols):
+        if price_scale:
+            o, h, l, c = (encode_prices(values[keep], price_scale) for values in columns[:4])
+        else:
+            o, h, l, c = (_to_list(values[keep]) for values in columns[:4])
+        v = np.nan_to_num(columns[4][keep]).astype(np.int64).tolist()
+
+        yield from zip(repeat(symbol), stamps[keep].tolist(), o, h, l, c, v)
+
+def iter_chunks(rows, size=CHUNK_ROWS):
+    """Group a row stream into lists of at most size rows"""
+    rows = iter(rows)
+    while True:
+        chunk = list(islice(rows, size))
+        if not chunk:
+            return
+        yield chunk
+
+_UPSERT = '''
+            ON CONFLICT({key}) DO UPDATE SET
+                open = excluded.open, high = excluded.high, low = excluded.low,
+                close = excluded.close, volume = excluded.volume, fetched_at = CURRENT_TIMESTAMP
+            WHERE (open, high, low, close, volume)
+                IS NOT (excluded.open, excluded.high, excluded.low, excluded.close, excluded.volume)'''
+
+def bulk_insert(conn, rows, interval='1m'):
+    """Write rows with a single executemany - caller commits"""
+    rows = list(rows)
+    if not rows:
+        return 0
+
+    # Unchanged candles (most of a re-fetched day) are left untouched
+    if interval == '1m':
+        conn.executemany(f'''
+            INSERT INTO {MINUTE_TABLE}
+            (symbol, datetime, open, high, low, close, volume)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            {_UPSERT.format(key='symbol, datetime')}
+        ''', rows)
+    else:
+        conn.executemany(f'''
+            INSERT INTO {BARS_TABLE}
+            (symbol, interval, datetime, open, high, low, close, volume)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            {_UPSERT.format(key='symbol, interval, datetime')}
+        ''', [(row[0], interval) + row[1:] for row in rows])
+
+    return len(rows)
+
+def store_frame(conn, data, symbols, interval='1m', chunk_rows=CHUNK_ROWS):
+    """Stream a wide frame into the DB in fixed-size chunks; returns (candles, stocks) - caller commits"""
+    seen = set()
+    price_scale = PRICE_SCALES.get(get_price_encoding(conn))
+
+    def tracked():
+        for row in frame_to_rows(data, symbols, price_scale):
+            seen.add(row[0])
+            yield row
+
+    candles = 0
+    for chunk in iter_chunks(tracked(), chunk_rows):
+        candles += bulk_insert(conn, chunk, interval)
+    return candles, len(seen)
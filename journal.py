@@ -0,0 +1,206 @@
+import argparse
+import logging
+import os
+import sqlite3
+from collections import namedtuple
+from datetime import date, datetime, timezone
+import numpy as np
+import market_calendar
+import profiles
+
+"""
+Run Journal - crash-safe progress of a fetch cycle, per profile DB
+Every batch commit also records which symbols it covered (same transaction
+as the candles, so a killed job loses both or neither). A run that finds an
+unfinished cycle resumes with the symbols it had not committed yet.
+Batches are ordered stalest-first, so the tail of the universe is not
+starved when runs get cut short, and per-symbol commit gaps are kept per
+session day for the staleness report.
+
+Usage:
+    python journal.py --report [--profile default] [--day 2025-09-01]
+    python journal.py --checkpoint      # fold WAL into the .db files before committing them
+"""
+
+Cycle = namedtuple('Cycle', ['profile', 'started', 'done'])
+
+def create_tables(conn):
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS fetch_journal (
+            profile TEXT NOT NULL,
+            cycle TEXT NOT NULL,
+            symbol TEXT NOT NULL,
+            committed_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+            PRIMARY KEY (profile, cycle, symbol)
+        )
+    ''')
+    # Epoch seconds; gap_sq_sum integrates staleness over the session
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS symbol_freshness (
+            profile TEXT NOT NULL,
+            day TEXT NOT NULL,
+            symbol TEXT NOT NULL,
+            last_commit INTEGER NOT NULL,
+            commits INTEGER NOT NULL,
+            max_gap INTEGER NOT NULL,
+            gap_sq_sum INTEGER NOT NULL,
+            PRIMARY KEY (profile, day, symbol)
+        )
+    ''')
+
+def open_cycle(db_path, profile, now, not_before=None):
+    """Unfinished cycle of a profile (resume) or a fresh one
+    A journal from an earlier session day, or started before `not_before`
+    (the schedule tick before the current one), is stale and discarded"""
+    conn = sqlite3.connect(db_path)
+    try:
+        create_tables(conn)
+        rows = conn.execute('SELECT cycle, symbol FROM fetch_journal WHERE profile = ?', (profile,)).fetchall()
+        if rows:
+            started = datetime.fromisoformat(min(row[0] for row in rows))
+            if session_day(started) != session_day(now) or (not_before is not None and started < not_before):
+                conn.execute('DELETE FROM fetch_journal WHERE profile = ?', (profile,))
+                logging.info(f"🗑️ {profile}: dropped stale journal of cycle {started.isoformat()} "
+                             f"({len(rows)} symbols)")
+                rows = []
+        conn.commit()
+    finally:
+        conn.close()
+    if not rows:
+        return Cycle(profile, now.astimezone(timezone.utc).isoformat(), set())
+    return Cycle(profile, min(row[0] for row in rows), {row[1] for row in rows})
+
+def session_day(now):
+    return now.astimezone(market_calendar.IST).date()
+
+def record(conn, cycle, symbols, traded, now):
+    """Journal a committed batch - caller commits together with the candles"""
+    create_tables(conn)
+    conn.executemany('INSERT OR IGNORE INTO fetch_journal (profile, cycle, symbol) VALUES (?, ?, ?)',
+                     [(cycle.profile, cycle.started, s) for s in symbols])
+
+    day = session_day(now)
+    stamp = int(now.timestamp())
+    bounds = market_calendar.session_bounds(day)
+    # First commit of the day: stale since the open
+    first_gap = max(0, stamp - int(bounds[0].timestamp())) if bounds else 0
+    conn.executemany('''
+        INSERT INTO symbol_freshness (profile, day, symbol, last_commit, commits, max_gap, gap_sq_sum)
+        VALUES (?, ?, ?, ?, 1, ?, ?)
+        ON CONFLICT(profile, day, symbol) DO UPDATE SET
+            commits = commits + 1,
+            max_gap = MAX(max_gap, excluded.last_commit - last_commit),
+            gap_sq_sum = gap_sq_sum + (excluded.last_commit - last_commit) * (excluded.last_commit - last_commit),
+            last_commit = excluded.last_commit
+    ''', [(cycle.profile, day.isoformat(), s, stamp, first_gap, first_gap * first_gap) for s in traded])
+
+def close_cycle(db_path, profile):
+    """Cycle finished - forget its journal"""
+    conn = sqlite3.connect(db_path)
+    try:
+        create_tables(conn)
+        conn.execute('DELETE FROM fetch_journal WHERE profile = ?', (profile,))
+        conn.commit()
+    finally:
+        conn.close()
+
+def last_commits(db_path, profile, day):
+    """symbol -> epoch seconds of its last commit today"""
+    conn = sqlite3.connect(db_path)
+    try:
+        create_tables(conn)
+        return dict(conn.execute('SELECT symbol, last_commit FROM symbol_freshness WHERE profile = ? AND day = ?',
+                                 (profile, day.isoformat())).fetchall())
+    finally:
+        conn.close()
+
+def rotate(symbols, last_seen):
+    """Stalest first (never committed today first), universe order among ties"""
+    return sorted(symbols, key=lambda s: last_seen.get(s, 0))
+
+def traded_symbols(panel):
+    """Symbols of a screener panel with at least one close"""
+    _, symbols, values = panel
+    has_close = ~np.isnan(values[:, :, 3]).all(axis=0)
+    return [s for s, ok in zip(symbols, has_close) if ok]
+
+def staleness(conn, profile, day, universe, until=None):
+    """Per-symbol (mean, max) staleness in seconds over the session, NaN if never committed"""
+    bounds = market_calendar.session_bounds(day)
+    if bounds is None:
+        return None
+    open_at = int(bounds[0].timestamp())
+    end = int((until or bounds[1]).timestamp())
+    rows = {row[0]: row[1:] for row in conn.execute('''
+        SELECT symbol, last_commit, max_gap, gap_sq_sum FROM symbol_freshness
+        WHERE profile = ? AND day = ?
+    ''', (profile, day.isoformat()))}
+
+    # Forced runs after the close still count - extend the window to the last commit
+    end = max([end] + [row[0] for row in rows.values()])
+    mean = np.full(len(universe), np.nan)
+    worst = np.full(len(universe), np.nan)
+    span = max(1, end - open_at)
+    for i, symbol in enumerate(universe):
+        if symbol not in rows:
+            continue
+        last, max_gap, gap_sq_sum = rows[symbol]
+        tail = max(0, end - last)
+        mean[i] = (gap_sq_sum + tail * tail) / (2 * span)
+        worst[i] = max(max_gap, tail)
+    return mean, worst
+
+def report(conn, profile, day, universe, until=None, deciles=10):
+    """Text report: staleness percentiles and head-vs-tail of the universe"""
+    result = staleness(conn, profile, day, universe, until)
+    if result is None:
+        return f"{day}: no session"
+    mean, worst = result
+    seen = ~np.isnan(mean)
+    lines = [f"Staleness {profile} {day}: {int(seen.sum())}/{len(universe)} symbols committed"]
+    if not seen.any():
+        return lines[0]
+    for label, values in (('mean', mean[seen]), ('max', worst[seen])):
+        p50, p90, p99 = np.percentile(values, [50, 90, 99])
+        lines.append(f"  {label:<5} p50 {p50:>7.0f}s  p90 {p90:>7.0f}s  p99 {p99:>7.0f}s  worst {values.max():>7.0f}s")
+    lines.append("  by universe position (mean / max staleness, median of decile):")
+    for k, part in enumerate(np.array_split(np.arange(len(universe)), deciles)):
+        part = part[seen[part]]
+        if len(part):
+            lines.append(f"    {k * 100 // deciles:>3}-{(k + 1) * 100 // deciles:<3}% "
+                         f"{np.median(mean[part]):>7.0f}s {np.median(worst[part]):>7.0f}s")
+    return '\n'.join(lines)
+
+def checkpoint(db_paths):
+    """Move committed WAL pages into the main files (git only tracks *.db)"""
+    for path in db_paths:
+        conn = sqlite3.connect(path)
+        try:
+            conn.execute('PRAGMA wal_checkpoint(TRUNCATE)')
+        finally:
+            conn.close()
+
+def main():
+    parser = argparse.ArgumentParser(description='Fetch run journal')
+    parser.add_argument('--report', action='store_true')
+    parser.add_argument('--checkpoint', action='store_true')
+    parser.add_argument('--profile', default='default', choices=sorted(profiles.PROFILES))
+    parser.add_argument('--day', type=date.fromisoformat, default=None)
+    args = parser.parse_args()
+
+    if args.checkpoint:
+        checkpoint([p.db_path for p in profiles.PROFILES.values() if os.path.exists(p.db_path)])
+    if args.report:
+        profile = profiles.PROFILES[args.profile]
+        day = args.day or market_calendar.now_ist().date()
+        until = min(datetime.now(timezone.utc), market_calendar.session_bounds(day)[1]) \
+            if market_calendar.session_bounds(day) else None
+        conn = sqlite3.connect(profile.db_path)
+        try:
+            create_tables(conn)
+            print(report(conn, profile.name, day, list(dict.fromkeys(profile.universe)), until))
+        finally:
+            conn.close()
+
+if __name__ == "__main__":
+    main()
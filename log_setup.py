@@ -0,0 +1,124 @@
+import atexit
+import logging
+import logging.handlers
+import os
+import queue
+import re
+
+"""
+Non-blocking logging - QueueHandler on the hot path, a QueueListener
+thread does the file / console I/O. Rotates the log file and folds the
+per-symbol yfinance download errors into one summary line per run.
+
+Environment:
+    LOG_LEVEL      DEBUG / INFO (default) / WARNING - use WARNING in production
+    LOG_ROTATION   'size' (default, LOG_MAX_BYTES x LOG_BACKUPS) or 'midnight'
+"""
+
+LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+LOG_MAX_BYTES = int(os.environ.get('LOG_MAX_BYTES', 1024 * 1024))
+LOG_BACKUPS = int(os.environ.get('LOG_BACKUPS', 5))
+
+_listener = None
+_failures = None
+
+# yfinance: "['A.NS', 'B.NS']: Exception('%ticker%: No price data found, ...')"
+_FAILED_LINE = re.compile(r"^\s*(\[.*?\]):\s*(.*)$", re.DOTALL)
+_SYMBOL = re.compile(r"'([^']+)'")
+_REASON = re.compile(r"%ticker%:\s*([^'\"(]+)")
+
+class DownloadFailureAggregator(logging.Filter):
+    """Swallow yfinance per-symbol error records and keep symbol -> reason for one summary line"""
+
+    def __init__(self):
+        super().__init__()
+        self.failures = {}
+
+    def filter(self, record):
+        if record.levelno < logging.ERROR or not record.name.startswith('yfinance'):
+            return True
+
+        message = record.getMessage()
+        if 'Failed download' in message:
+            return False
+        match = _FAILED_LINE.match(message)
+        if not match:
+            return True
+        symbols = _SYMBOL.findall(match.group(1))
+        if not symbols:
+            return True
+
+        reason = _REASON.search(match.group(2))
+        reason = reason.group(1).strip(' ,') if reason else match.group(2).strip()[:80]
+        for symbol in symbols:
+            self.failures[symbol] = reason
+        return False
+
+    def flush(self, logger=None):
+        """Log one aggregated line for everything collected so far, then reset"""
+        if not self.failures:
+            return
+        by_reason = {}
+        for symbol, reason in self.failures.items():
+            by_reason.setdefault(reason, []).append(symbol)
+
+        parts = []
+        for reason, symbols in sorted(by_reason.items(), key=lambda item: -len(item[1])):
+            sample = ', '.join(symbols[:5]) + (', ...' if len(symbols) > 5 else '')
+            parts.append(f"{reason} ({len(symbols)}: {sample})")
+        (logger or logging.getLogger()).warning(
+            f"⚠️ {len(self.failures)} symbols failed download - " + '; '.join(parts))
+        self.failures = {}
+
+def _file_handler(log_file):
+    """Rotating file handler picked by LOG_ROTATION"""
+    if os.environ.get('LOG_ROTATION', 'size') == 'midnight':
+        return logging.handlers.TimedRotatingFileHandler(
+            log_file, when='midnight', backupCount=LOG_BACKUPS, encoding='utf-8')
+    return logging.handlers.RotatingFileHandler(
+        log_file, maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUPS, encoding='utf-8')
+
+def setup_logging(log_file='data_fetch.log', level=None, console=True):
+    """Route the root logger through a queue to a rotating file (+ console)"""
+    global _listener, _failures
+    if _listener is not None:
+        return
+
+    level = level or os.environ.get('LOG_LEVEL', 'INFO').upper()
+    formatter = logging.Formatter(LOG_FORMAT)
+    handlers = [_file_handler(log_file)]
+    if console:
+        handlers.append(logging.StreamHandler())
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    log_queue = queue.SimpleQueue()
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    _failures = DownloadFailureAggregator()
+    queue_handler.addFilter(_failures)
+
+    root = logging.getLogger()
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+    root.addHandler(queue_handler)
+    root.setLevel(level)
+
+    _listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    atexit.register(shutdown_logging)
+
+def flush_failures():
+    """Emit the aggregated download-failure line for this run"""
+    if _failures is not None:
+        _failures.flush()
+
+def shutdown_logging():
+    """Flush pending records and stop the listener thread"""
+    global _listener
+    if _listener is None:
+        return
+    flush_failures()
+    _listener.stop()
+    for handler in _listener.handlers:
+        handler.close()
+    _listener = None
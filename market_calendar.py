@@ -0,0 +1,154 @@
+import argparse
+import logging
+import os
+import sys
+from datetime import datetime, date, time, timedelta, timezone
+
+"""
+NSE Trading Calendar - session hours, holidays, special sessions
+Standard library only, so the workflows can call it before installing
+dependencies and skip the whole job outside market hours.
+
+Usage:
+    python market_calendar.py                  # exit 0 if a fetch is due now, 1 otherwise
+    python market_calendar.py --report "*/1 3-10 * * 1-5" --week 2025-10-20
+"""
+
+IST = timezone(timedelta(hours=5, minutes=30), 'IST')
+SESSION_OPEN = time(9, 15)
+SESSION_CLOSE = time(15, 30)
+CLOSE_GRACE = timedelta(minutes=5)  # Last bar lands a little after 15:30
+HOLIDAY_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'nse_holidays.txt')
+
+_calendar = None
+
+def load_calendar(path=HOLIDAY_FILE):
+    """Parse the holiday file into (holidays, special_sessions)"""
+    holidays = {}
+    special = {}
+    if not os.path.exists(path):
+        return holidays, special
+
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            line = line.split('#', 1)[0].strip()
+            if not line:
+                continue
+            parts = line.split(None, 2)
+            day = date.fromisoformat(parts[0])
+            if len(parts) > 1 and '-' in parts[1] and ':' in parts[1]:
+                start, end = parts[1].split('-')
+                special[day] = (time.fromisoformat(start), time.fromisoformat(end))
+            else:
+                holidays[day] = ' '.join(parts[1:])
+    return holidays, special
+
+def get_calendar():
+    """Cached calendar"""
+    global _calendar
+    if _calendar is None:
+        _calendar = load_calendar()
+    return _calendar
+
+def session_bounds(day):
+    """(open, close) IST datetimes for a trading day, or None if the market is shut"""
+    holidays, special = get_calendar()
+    if day in special:
+        start, end = special[day]
+    elif day.weekday() >= 5 or day in holidays:
+        return None
+    else:
+        start, end = SESSION_OPEN, SESSION_CLOSE
+    return datetime.combine(day, start, IST), datetime.combine(day, end, IST)
+
+def now_ist():
+    """Current time in IST"""
+    return datetime.now(IST)
+
+def is_session_open(now=None):
+    """True while a session is live (plus a short grace after the close)"""
+    now = (now or now_ist()).astimezone(IST)
+    bounds = session_bounds(now.date())
+    return bounds is not None and bounds[0] <= now <= bounds[1] + CLOSE_GRACE
+
+def should_run(now=None):
+    """Fetch gate used at the top of main(); FORCE_RUN=1 bypasses it for manual runs"""
+    if os.environ.get('FORCE_RUN') == '1':
+        return True
+    now = (now or now_ist()).astimezone(IST)
+    holidays, special = get_calendar()
+    if not any(day.year == now.year for day in list(holidays) + list(special)):
+        logging.warning(f"⚠️ {os.path.basename(HOLIDAY_FILE)} has no {now.year} entries - "
+                        f"exchange holidays will run full fetches until this year's circular is added")
+    return is_session_open(now)
+
+def fetch_window(now=None):
+    """Today's fetch window clamped to session bounds, or None outside a session"""
+    now = (now or now_ist()).astimezone(IST)
+    bounds = session_bounds(now.date())
+    if bounds is None or now < bounds[0]:
+        return None
+    return bounds[0], min(now, bounds[1])
+
+def _cron_field(field, value, low):
+    """Match one cron field (*, */n, a-b, a-b/n, lists)"""
+    for part in field.split(','):
+        part, _, step = part.partition('/')
+        step = int(step or 1)
+        if part == '*':
+            start, end = low, 10 ** 6
+        elif '-' in part:
+            start, end = map(int, part.split('-'))
+        else:
+            start = end = int(part)
+        if start <= value <= end and (value - start) % step == 0:
+            return True
+    return False
+
+def cron_matches(expr, moment):
+    """True if a 5-field cron expression fires at a UTC minute"""
+    minute, hour, dom, month, dow = expr.split()
+    return (_cron_field(minute, moment.minute, 0) and _cron_field(hour, moment.hour, 0)
+            and _cron_field(dom, moment.day, 1) and _cron_field(month, moment.month, 1)
+            and _cron_field(dow, (moment.weekday() + 1) % 7, 0))
+
+def weekly_savings(expr, week_start, symbols):
+    """Simulate a cron schedule over one week: (runs, runs saved, requests, requests saved)"""
+    moment = datetime.combine(week_start, time(0, 0), timezone.utc)
+    end = moment + timedelta(days=7)
+    runs = saved = 0
+    while moment < end:
+        if cron_matches(expr, moment):
+            runs += 1
+            if not is_session_open(moment):
+                saved += 1
+        moment += timedelta(minutes=1)
+    return runs, saved, runs * symbols, saved * symbols
+
+def main():
+    """Gate check (exit code) or weekly savings report"""
+    parser = argparse.ArgumentParser(description='NSE trading calendar')
+    parser.add_argument('--report', metavar='CRON', help='report runs saved for a cron schedule (UTC)')
+    parser.add_argument('--week', type=date.fromisoformat, default=None,
+                        help='week start for --report (default: this Monday)')
+    parser.add_argument('--symbols', type=int, default=1500)
+    args = parser.parse_args()
+
+    if args.report:
+        week = args.week or (now_ist().date() - timedelta(days=now_ist().weekday()))
+        runs, saved, requests, requests_saved = weekly_savings(args.report, week, args.symbols)
+        fraction = saved / runs if runs else 0.0
+        print(f"Week of {week}  cron '{args.report}'")
+        print(f"  Runs:     {runs:,} scheduled, {saved:,} skipped ({fraction:.1%})")
+        print(f"  Requests: {requests:,} scheduled, {requests_saved:,} saved ({fraction:.1%})")
+        return 0
+
+    is_open = should_run()
+    if 'GITHUB_OUTPUT' in os.environ:
+        with open(os.environ['GITHUB_OUTPUT'], 'a') as f:
+            f.write(f"open={'true' if is_open else 'false'}\n")
+    print(f"{now_ist():%Y-%m-%d %H:%M:%S} IST - market {'open' if is_open else 'closed'}")
+    return 0 if is_open else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
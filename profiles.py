@@ -0,0 +1,163 @@
+import argparse
+import sqlite3
+from collections import namedtuple
+from datetime import datetime, date, timedelta, timezone
+import market_calendar
+import universes
+
+"""
+Fetch Profiles - named (universe, interval, schedule, target DB) sets
+data_fetch.py runs every due profile in one tick, fetching the union of
+their universes once and fanning the candles out to each profile's DB.
+
+Usage: python profiles.py --report [--day 2025-09-01]   # per-session dedup savings
+"""
+
+Profile = namedtuple('Profile', [
+    'name',           # --only NAME
+    'universe',       # symbol list (duplicates are fetched once)
+    'interval',       # yfinance interval
+    'schedule',       # cron, UTC (market_calendar gates the session)
+    'db_path',
+    'snapshot_path',  # mmap latest-bar snapshot (None = off)
+    'readme_path',    # README screener section (None = off)
+    'price_encoding', # 'paise' = integer OHLC for a new DB (None = REAL), see ingest.py
+], defaults=[None])
+
+BENCHMARK = '^NSEI'  # NIFTY 50 - fetched and stored with every profile (beta in correlation.py)
+
+PROFILES = {
+    'default': Profile('default', universes.STOCK_LIST, '1m', '0,15,30,45 * * * *',
+                       'nifty50_top20.db', 'latest_snapshot.bin', 'README.md'),
+    'v1': Profile('v1', universes.STOCK_LIST_1500, '1m', '* * * * *',
+                  'nifty50_top20_v1.db', 'latest_snapshot_v1.bin', None),
+}
+
+def last_fire(schedule, now, lookback_minutes=24 * 60):
+    """Most recent minute (UTC) at or before now when the cron fired"""
+    moment = now.astimezone(timezone.utc).replace(second=0, microsecond=0)
+    for _ in range(lookback_minutes):
+        if market_calendar.cron_matches(schedule, moment):
+            return moment
+        moment -= timedelta(minutes=1)
+    return None
+
+def previous_fire(schedule, now):
+    """The fire before the most recent one - a cycle started earlier is over a period old"""
+    fired = last_fire(schedule, now)
+    if fired is None:
+        return None
+    return last_fire(schedule, fired - timedelta(minutes=1))
+
+def _state(conn):
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS profile_runs (
+            profile TEXT PRIMARY KEY,
+            last_run DATETIME NOT NULL
+        )
+    ''')
+
+def last_run(profile):
+    """When this profile last completed a tick (UTC), or None"""
+    try:
+        conn = sqlite3.connect(profile.db_path)
+        try:
+            _state(conn)
+            row = conn.execute('SELECT last_run FROM profile_runs WHERE profile = ?',
+                               (profile.name,)).fetchone()
+        finally:
+            conn.close()
+    except sqlite3.Error:
+        return None
+    return datetime.fromisoformat(row[0]) if row else None
+
+def mark_run(profile, now):
+    """Record a completed tick"""
+    conn = sqlite3.connect(profile.db_path)
+    try:
+        _state(conn)
+        conn.execute('INSERT OR REPLACE INTO profile_runs (profile, last_run) VALUES (?, ?)',
+                     (profile.name, now.astimezone(timezone.utc).isoformat()))
+        conn.commit()
+    finally:
+        conn.close()
+
+def due_profiles(now, names=None):
+    """Profiles whose schedule fired since their last run (late cron ticks still count)"""
+    if names:
+        return [PROFILES[name] for name in names]
+    due = []
+    for profile in PROFILES.values():
+        fired = last_fire(profile.schedule, now)
+        previous = last_run(profile)
+        if fired is not None and (previous is None or previous < fired):
+            due.append(profile)
+    return due
+
+def fetched_symbols(profile):
+    """What a profile fetches and stores: its universe plus the benchmark index"""
+    return list(dict.fromkeys(list(profile.universe) + [BENCHMARK]))
+
+def union_universe(profiles):
+    """Distinct symbols fetched across profiles, first-seen order"""
+    return list(dict.fromkeys(symbol for profile in profiles for symbol in fetched_symbols(profile)))
+
+def upstream_requests(symbols, batch_size=500):
+    """Symbols actually requested when a list is fetched in batches (yfinance dedups within a call)"""
+    return sum(len(set(symbols[i:i + batch_size])) for i in range(0, len(symbols), batch_size))
+
+def session_report(day):
+    """Simulate one session: symbol requests / downloads / decoded bytes, per profile vs union"""
+    bounds = market_calendar.session_bounds(day)
+    if bounds is None:
+        return None
+    open_at, close_at = bounds
+    moment = open_at.astimezone(timezone.utc)
+    end = (close_at + market_calendar.CLOSE_GRACE).astimezone(timezone.utc)
+
+    separate = [0, 0, 0]   # symbol requests, yf.download calls, bytes
+    merged = [0, 0, 0]
+    while moment <= end:
+        due = [p for p in PROFILES.values() if market_calendar.cron_matches(p.schedule, moment)]
+        # period='1d' / session window: every request returns all bars since the open
+        bars = max(1, min(375, int((moment - open_at).total_seconds() // 60)))
+        bytes_per_symbol = bars * 5 * 8
+        for profile in due:
+            requested = upstream_requests(profile.universe)
+            separate[0] += requested
+            separate[1] += -(-len(profile.universe) // 500)
+            separate[2] += requested * bytes_per_symbol
+        if due:
+            symbols = len(union_universe(due))
+            merged[0] += symbols
+            merged[1] += -(-symbols // 500)
+            merged[2] += symbols * bytes_per_symbol
+        moment += timedelta(minutes=1)
+    return separate, merged
+
+def main():
+    """Print the per-session savings of fetching the profile union once"""
+    parser = argparse.ArgumentParser(description='Fetch profiles')
+    parser.add_argument('--report', action='store_true')
+    parser.add_argument('--day', type=date.fromisoformat, default=date(2025, 9, 1))
+    args = parser.parse_args()
+
+    for profile in PROFILES.values():
+        print(f"{profile.name:<8} {len(profile.universe):>5} symbols ({len(set(profile.universe))} distinct) "
+              f"'{profile.schedule}' -> {profile.db_path}")
+    if not args.report:
+        return
+
+    report = session_report(args.day)
+    if report is None:
+        print(f"{args.day}: no session")
+        return
+    separate, merged = report
+    print(f"\nSession {args.day}:")
+    for label, i, unit in (('symbol requests', 0, 1), ('yf.download calls', 1, 1), ('decoded MB (est.)', 2, 1e6)):
+        saved = separate[i] - merged[i]
+        print(f"  {label:<18} {separate[i] / unit:>12,.0f} separate  {merged[i] / unit:>12,.0f} union  "
+              f"saved {saved / unit:,.0f} ({saved / separate[i]:.1%})")
+
+if __name__ == "__main__":
+    main()
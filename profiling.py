@@ -0,0 +1,151 @@
+import cProfile
+import logging
+import os
+import pstats
+import sys
+import threading
+import time
+from collections import Counter
+from datetime import datetime
+from functools import wraps
+
+"""
+Hot-path profiling for one fetch cycle - only imported when --profile is given,
+so a normal run executes exactly the same code as before.
+cProfile gives the deterministic call tree of the calling thread (.prof
+dump + top-N cumulative report); a stack sampler thread runs alongside and
+writes collapsed stacks of every thread, each prefixed with its thread name
+(flamegraph.pl / speedscope / inferno), so work in yfinance's download
+threads shows up next to the main thread for the same time span.
+Whole cycle by default, or only chosen stages: the stage functions are
+wrapped for the duration of the run and profiling is on only inside them.
+
+Output: logs/profiles/<name>_<YYYYmmdd_HHMMSS>.{prof,txt,collapsed}
+"""
+
+PROFILE_DIR = os.path.join('logs', 'profiles')
+TOP_N = 40                # Functions in the cumulative-time report
+SAMPLE_INTERVAL = 0.005   # Seconds between stack samples
+
+class StackSampler:
+    """Wall-clock sampler of every thread's Python stack -> collapsed stack counts"""
+
+    def __init__(self, interval=SAMPLE_INTERVAL):
+        self.interval = interval
+        self.counts = Counter()
+        self.active = False
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name='stack-sampler', daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            if not self.active:
+                continue
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for ident, frame in sys._current_frames().items():
+                if ident == self._thread.ident:
+                    continue
+                stack = []
+                while frame is not None:
+                    code = frame.f_code
+                    stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+                    frame = frame.f_back
+                stack.append(names.get(ident, f"thread-{ident}"))
+                self.counts[';'.join(reversed(stack))] += 1
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def collapsed(self):
+        """'thread;root;caller;callee count' lines"""
+        return ''.join(f"{stack} {count}\n" for stack, count in self.counts.most_common())
+
+class CycleProfiler:
+    """cProfile + stack sampler, switched on around the profiled code only"""
+
+    def __init__(self, name, top=TOP_N, interval=SAMPLE_INTERVAL, out_dir=PROFILE_DIR):
+        self.name = name
+        self.top = top
+        self.out_dir = out_dir
+        self.profile = cProfile.Profile()
+        self.sampler = StackSampler(interval)
+        self.depth = 0
+        self.calls = Counter()
+        self.seconds = Counter()
+
+    def enter(self):
+        if self.depth == 0:
+            self.sampler.active = True
+            self.profile.enable()
+        self.depth += 1
+
+    def exit(self):
+        self.depth -= 1
+        if self.depth == 0:
+            self.profile.disable()
+            self.sampler.active = False
+
+    def wrap(self, func, label):
+        """func with profiling switched on for the duration of each call"""
+        @wraps(func)
+        def profiled(*args, **kwargs):
+            start = time.perf_counter()
+            self.enter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self.exit()
+                self.calls[label] += 1
+                self.seconds[label] += time.perf_counter() - start
+        return profiled
+
+    def write(self):
+        """Dump .prof, the top-N text report and collapsed stacks; returns the base path"""
+        os.makedirs(self.out_dir, exist_ok=True)
+        base = os.path.join(self.out_dir, f"{self.name}_{datetime.now():%Y%m%d_%H%M%S}")
+        self.profile.dump_stats(base + '.prof')
+
+        with open(base + '.txt', 'w') as f:
+            f.write(f"Profile: {self.name} ({datetime.now():%Y-%m-%d %H:%M:%S})\n")
+            f.write("  cProfile: calling thread only; stack samples: every thread (see .collapsed)\n\n")
+            for label, seconds in self.seconds.most_common():
+                f.write(f"  {label:<24} {self.calls[label]:>5} calls {seconds:>10.3f} s\n")
+            threads = Counter()
+            for stack, count in self.sampler.counts.items():
+                threads[stack.split(';', 1)[0]] += count
+            f.write(f"\n  {sum(threads.values())} stack samples every {self.sampler.interval * 1000:g} ms: "
+                    f"{', '.join(f'{name} {count}' for name, count in threads.most_common())}\n\n")
+            stats = pstats.Stats(self.profile, stream=f)
+            stats.strip_dirs().sort_stats('cumulative').print_stats(self.top)
+
+        with open(base + '.collapsed', 'w') as f:
+            f.write(self.sampler.collapsed())
+        return base
+
+def profile_call(name, func, args=(), targets=None, top=TOP_N, interval=SAMPLE_INTERVAL):
+    """Run func(*args) under the profiler - whole call, or only inside targets [(label, owner, attr)]"""
+    profiler = CycleProfiler(name, top, interval)
+    patched = []
+    for label, owner, attr in targets or []:
+        original = getattr(owner, attr)
+        setattr(owner, attr, profiler.wrap(original, label))
+        patched.append((owner, attr, original))
+    if not targets:
+        func = profiler.wrap(func, 'cycle')
+
+    profiler.sampler.start()
+    try:
+        return func(*args)
+    finally:
+        profiler.sampler.stop()
+        for owner, attr, original in reversed(patched):
+            setattr(owner, attr, original)
+        base = profiler.write()
+        timings = ', '.join(f"{label} {seconds:.2f}s" for label, seconds in profiler.seconds.most_common())
+        logging.info(f"🔬 Profile written: {base}.{{prof,txt,collapsed}} ({timings or 'nothing profiled'})")
@@ -0,0 +1,272 @@
+import argparse
+import asyncio
+import gzip
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import time
+from urllib.parse import urlsplit, parse_qs
+import snapshot
+
+"""
+Local Read Service - asyncio HTTP over the fetcher's database
+Serves latest quotes, candle ranges and run stats from an in-process
+cache that is rebuilt when the fetcher finishes a cycle (the snapshot
+sequence number / DB file changes). Every body carries an ETag and is
+pre-gzipped once, so polling clients mostly get 304 Not Modified.
+
+Endpoints:
+    GET /quotes[?symbols=A.NS,B.NS]
+    GET /candles?symbol=A.NS[&start=2025-09-01 09:15:00][&end=...][&limit=375]
+    GET /stats
+
+Usage: python read_service.py --db nifty50_top20.db --snapshot latest_snapshot.bin --port 8080
+"""
+
+POLL_SECONDS = 1.0       # How often to look for a finished fetch cycle
+CANDLE_LIMIT = 375       # One session of 1-minute bars
+CANDLE_CACHE_SIZE = 512  # Candle range responses kept per cycle
+GZIP_MIN_BYTES = 512
+
+class Body:
+    """Encoded response body with ETag and lazily built gzip variant"""
+
+    def __init__(self, payload):
+        self.raw = json.dumps(payload, separators=(',', ':')).encode()
+        self.etag = '"' + hashlib.blake2b(self.raw, digest_size=10).hexdigest() + '"'
+        self._gzipped = None
+
+    def gzipped(self):
+        if self._gzipped is None:
+            self._gzipped = gzip.compress(self.raw, compresslevel=6)
+        return self._gzipped
+
+class ReadCache:
+    """Per-cycle cache of response bodies"""
+
+    def __init__(self, db_path, snapshot_path=None):
+        self.db_path = db_path
+        self.snapshot_path = snapshot_path
+        self.marker = None
+        self.quotes = {}
+        self.quote_bodies = {}
+        self.candles = {}
+        self.stats = Body({})
+
+    def _connect(self):
+        conn = sqlite3.connect(f'file:{self.db_path}?mode=ro', uri=True, timeout=30)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def cycle_marker(self):
+        """Changes whenever the fetcher completes a cycle"""
+        if self.snapshot_path and os.path.exists(self.snapshot_path):
+            with open(self.snapshot_path, 'rb') as f:
+                _, _, _, seq, minute, _ = snapshot.HEADER.unpack(f.read(snapshot.HEADER.size))
+            return ('snapshot', seq, minute, os.stat(self.snapshot_path).st_ino)
+        stamps = []
+        for path in (self.db_path, self.db_path + '-wal'):
+            try:
+                stamps.append(os.stat(path).st_mtime_ns)
+            except FileNotFoundError:
+                stamps.append(0)
+        return ('db',) + tuple(stamps)
+
+    def refresh(self):
+        """Reload quotes and stats from SQLite (runs in a worker thread)"""
+        conn = self._connect()
+        try:
+            rows = conn.execute('''
+                SELECT d.symbol, d.datetime, d.open, d.high, d.low, d.close, d.volume
+                FROM stock_1min_prices d
+                JOIN (SELECT symbol, MAX(datetime) AS latest FROM stock_1min_data GROUP BY symbol) m
+                  ON d.symbol = m.symbol AND d.datetime = m.latest
+            ''').fetchall()
+            total, symbols, latest = conn.execute(
+                'SELECT COUNT(*), COUNT(DISTINCT symbol), MAX(datetime) FROM stock_1min_data').fetchone()
+        finally:
+            conn.close()
+
+        quotes = {row['symbol']: dict(row) for row in rows}
+        stats = {
+            'total_candles': total,
+            'unique_stocks': symbols,
+            'latest': latest,
+            'db_size_mb': round(os.path.getsize(self.db_path) / (1024 * 1024), 2),
+            'refreshed_at': time.strftime('%Y-%m-%d %H:%M:%S'),
+        }
+        return quotes, Body(stats)
+
+    def apply(self, marker, refreshed):
+        """Swap in a new cycle's data (event loop thread)"""
+        self.quotes, self.stats = refreshed
+        self.quote_bodies = {None: Body(sorted(self.quotes.values(), key=lambda q: q['symbol']))}
+        self.candles = {}
+        self.marker = marker
+
+    def quotes_body(self, symbols):
+        """Body for all quotes or a symbol subset"""
+        key = None if not symbols else tuple(sorted(set(symbols)))
+        body = self.quote_bodies.get(key)
+        if body is None:
+            body = Body([self.quotes[s] for s in key if s in self.quotes])
+            if len(self.quote_bodies) < CANDLE_CACHE_SIZE:
+                self.quote_bodies[key] = body
+        return body
+
+    def load_candles(self, symbol, start, end, limit):
+        """Candle range query (runs in a worker thread)"""
+        conn = self._connect()
+        try:
+            rows = conn.execute('''
+                SELECT datetime, open, high, low, close, volume FROM stock_1min_prices
+                WHERE symbol = ? AND datetime >= ? AND datetime <= ?
+                ORDER BY datetime DESC LIMIT ?
+            ''', (symbol, start, end, limit)).fetchall()
+        finally:
+            conn.close()
+        return Body({'symbol': symbol, 'candles': [dict(row) for row in reversed(rows)]})
+
+class ReadService:
+    """Tiny HTTP/1.1 server (keep-alive, GET/HEAD only)"""
+
+    def __init__(self, cache):
+        self.cache = cache
+        self.requests = 0
+        self.not_modified = 0
+
+    async def watch(self):
+        """Refresh the cache whenever a new cycle lands"""
+        while True:
+            try:
+                marker = self.cache.cycle_marker()
+                if marker != self.cache.marker:
+                    refreshed = await asyncio.to_thread(self.cache.refresh)
+                    self.cache.apply(marker, refreshed)
+                    logging.info(f"🔁 Cache refreshed: {len(self.cache.quotes)} quotes")
+            except (sqlite3.Error, OSError) as e:
+                logging.warning(f"⚠️ Cache refresh failed: {str(e)}")
+            await asyncio.sleep(POLL_SECONDS)
+
+    async def route(self, path, query):
+        """Resolve a request to (status, Body)"""
+        if path == '/quotes':
+            symbols = [s for s in query.get('symbols', [''])[0].split(',') if s]
+            return 200, self.cache.quotes_body(symbols)
+        if path == '/stats':
+            return 200, self.cache.stats
+        if path == '/candles':
+            symbol = query.get('symbol', [None])[0]
+            if not symbol:
+                return 400, Body({'error': 'symbol is required'})
+            # Full timestamps - a bare '9999' would get NUMERIC affinity and compare as a number
+            start = query.get('start', ['0000-01-01 00:00:00'])[0]
+            end = query.get('end', ['9999-12-31 23:59:59'])[0]
+            try:
+                # LIMIT -1 (any negative) means no limit to SQLite - keep it in 1..5000
+                limit = max(1, min(int(query.get('limit', [CANDLE_LIMIT])[0]), 5000))
+            except ValueError:
+                return 400, Body({'error': 'limit must be an integer'})
+            key = (symbol, start, end, limit)
+            body = self.cache.candles.get(key)
+            if body is None:
+                try:
+                    body = await asyncio.to_thread(self.cache.load_candles, *key)
+                except sqlite3.OperationalError as e:   # locked / busy while the fetcher writes
+                    logging.warning(f"⚠️ Candle query failed: {str(e)}")
+                    return 503, Body({'error': 'database busy, retry'})
+                except sqlite3.Error as e:
+                    logging.warning(f"⚠️ Candle query failed: {str(e)}")
+                    return 500, Body({'error': 'database error'})
+                if len(self.cache.candles) < CANDLE_CACHE_SIZE:
+                    self.cache.candles[key] = body
+            return 200, body
+        return 404, Body({'error': 'not found'})
+
+    def response(self, status, body, headers, head_only):
+        """Serialize one response, honouring If-None-Match and Accept-Encoding"""
+        reason = {200: 'OK', 304: 'Not Modified', 400: 'Bad Request', 404: 'Not Found',
+                  405: 'Method Not Allowed', 500: 'Internal Server Error', 503: 'Service Unavailable'}[status]
+        out = [f'HTTP/1.1 {status} {reason}', 'Cache-Control: no-cache', 'Vary: Accept-Encoding']
+        if status == 503:
+            out.append('Retry-After: 1')
+
+        if status == 200:
+            out.append(f'ETag: {body.etag}')
+            if body.etag in headers.get('if-none-match', ''):
+                self.not_modified += 1
+                return ('\r\n'.join(['HTTP/1.1 304 Not Modified', f'ETag: {body.etag}',
+                                     'Cache-Control: no-cache', '', '']).encode())
+
+        payload = body.raw
+        if len(payload) >= GZIP_MIN_BYTES and 'gzip' in headers.get('accept-encoding', ''):
+            payload = body.gzipped()
+            out.append('Content-Encoding: gzip')
+        out += ['Content-Type: application/json', f'Content-Length: {len(payload)}', '', '']
+        return '\r\n'.join(out).encode() + (b'' if head_only else payload)
+
+    async def handle(self, reader, writer):
+        """Serve requests on one keep-alive connection"""
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b'\r\n\r\n')
+                except (asyncio.IncompleteReadError, asyncio.LimitOverrunError):
+                    break
+                lines = head.decode('latin-1').split('\r\n')
+                method, target, version = (lines[0].split(' ') + ['', '', ''])[:3]
+                headers = {}
+                for line in lines[1:]:
+                    name, _, value = line.partition(':')
+                    if name:
+                        headers[name.strip().lower()] = value.strip()
+
+                self.requests += 1
+                if method not in ('GET', 'HEAD'):
+                    writer.write(self.response(405, Body({'error': 'method not allowed'}), {}, False))
+                else:
+                    url = urlsplit(target)
+                    status, body = await self.route(url.path, parse_qs(url.query))
+                    writer.write(self.response(status, body, headers, method == 'HEAD'))
+                await writer.drain()
+
+                if headers.get('connection', '').lower() == 'close' or version == 'HTTP/1.0':
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+async def serve(db_path, snapshot_path, host, port):
+    """Run the service until cancelled"""
+    cache = ReadCache(db_path, snapshot_path)
+    service = ReadService(cache)
+    cache.apply(cache.cycle_marker(), await asyncio.to_thread(cache.refresh))
+    watcher = asyncio.create_task(service.watch())
+    server = await asyncio.start_server(service.handle, host, port, backlog=1024)
+    logging.info(f"🌐 Read service on http://{host}:{port} ({db_path})")
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        watcher.cancel()
+
+def main():
+    """Parse arguments and serve"""
+    parser = argparse.ArgumentParser(description='Local read service for the stock database')
+    parser.add_argument('--db', default='nifty50_top20.db')
+    parser.add_argument('--snapshot', default='latest_snapshot.bin')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8080)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    try:
+        asyncio.run(serve(args.db, args.snapshot, args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,250 @@
+import logging
+import time
+import warnings
+from datetime import timedelta
+import numpy as np
+import pandas as pd
+from tabulate import tabulate
+import ingest
+
+"""
+Cross-Sectional Screener - latest minute, whole universe at once
+Works on the downloaded multi-ticker frames as (bars, symbols) NumPy
+arrays: top gainers/losers, volume spikes vs the trailing average and
+new intraday highs/lows, ranked and z-scored in one pass.
+"""
+
+FIELDS = ['Open', 'High', 'Low', 'Close', 'Volume']
+VOLUME_WINDOW = 20        # Trailing bars for the volume average
+VOLUME_SPIKE = 3.0        # Flag when volume >= 3x trailing average
+TOP_N = 10                # Gainers / losers kept per minute
+README_MARKERS = ('<!-- screener:start -->', '<!-- screener:end -->')
+
+def to_panel(data, symbols):
+    """Wide yf.download frame -> (index, symbols, array[bars, symbols, field])"""
+    if not isinstance(data.columns, pd.MultiIndex):
+        data = pd.concat({symbols[0]: data}, axis=1)
+    symbols = list(dict.fromkeys(symbols))
+    columns = pd.MultiIndex.from_product([symbols, FIELDS])
+    # May be a read-only view under pandas 3 - panels are never written in place;
+    # prices keep their float32 noise, consumers snap the few rows they output
+    values = data.reindex(columns=columns).to_numpy(dtype='float64')
+    return data.index, symbols, values.reshape(len(data.index), len(symbols), len(FIELDS))
+
+def select(panel, symbols):
+    """Sub-panel for a subset of a panel's symbols (column order of symbols)"""
+    index, panel_symbols, values = panel
+    symbols = list(dict.fromkeys(symbols))
+    positions = {symbol: i for i, symbol in enumerate(panel_symbols)}
+    return index, symbols, values[:, [positions[s] for s in symbols], :]
+
+def merge_panels(panels):
+    """Concatenate per-batch panels along the symbol axis (aligned on time)"""
+    panels = [p for p in panels if p[2].size]
+    if not panels:
+        return None
+    index = panels[0][0]
+    for other, _, _ in panels[1:]:
+        index = index.union(other)
+
+    symbols, blocks = [], []
+    for p_index, p_symbols, values in panels:
+        if not p_index.equals(index):
+            pos = index.get_indexer(p_index)
+            aligned = np.full((len(index),) + values.shape[1:], np.nan)
+            aligned[pos] = values
+            values = aligned
+        symbols.extend(p_symbols)
+        blocks.append(values)
+    return index, symbols, np.concatenate(blocks, axis=1)
+
+def _zscore(values):
+    """Cross-sectional z-score ignoring NaNs"""
+    std = np.nanstd(values)
+    if not std:
+        return np.zeros_like(values)
+    return (values - np.nanmean(values)) / std
+
+def _rank(values):
+    """1 = largest; NaNs ranked last"""
+    order = np.argsort(np.where(np.isnan(values), -np.inf, values))[::-1]
+    ranks = np.empty(len(values), dtype='int64')
+    ranks[order] = np.arange(1, len(values) + 1)
+    return ranks
+
+def compute(panel, trailing_volume=None):
+    """Screener metrics for the latest bar of every symbol"""
+    index, symbols, values = panel
+    opens, highs, lows, close, volume = (values[:, :, j] for j in range(len(FIELDS)))
+    last = len(index) - 1
+
+    # All-NaN columns (untraded symbols) are expected - keep them quiet
+    with np.errstate(invalid='ignore', divide='ignore'), warnings.catch_warnings():
+        warnings.simplefilter('ignore', RuntimeWarning)
+        # Day change vs the first traded open
+        first_open = ingest.snap_prices(opens[np.argmax(~np.isnan(opens), axis=0), np.arange(len(symbols))])
+        latest_close = ingest.snap_prices(close[last])
+        gain_pct = (latest_close / first_open - 1) * 100
+
+        # Volume vs trailing bars (stored stats fill in early in the session)
+        trailing = volume[max(0, last - VOLUME_WINDOW):last]
+        avg_volume = np.nanmean(trailing, axis=0) if len(trailing) else np.full(len(symbols), np.nan)
+        std_volume = np.nanstd(trailing, axis=0) if len(trailing) else np.full(len(symbols), np.nan)
+        if trailing_volume is not None:
+            # Too few bars in today's frame - fall back to the stored average
+            use_stored = np.isnan(avg_volume) | (len(trailing) < 5)
+            avg_volume = np.where(use_stored & ~np.isnan(trailing_volume), trailing_volume, avg_volume)
+        volume_ratio = volume[last] / avg_volume
+        volume_z = (volume[last] - avg_volume) / std_volume
+
+        prior_high = np.nanmax(highs[:last], axis=0) if last else np.full(len(symbols), np.nan)
+        prior_low = np.nanmin(lows[:last], axis=0) if last else np.full(len(symbols), np.nan)
+        new_high = highs[last] > prior_high
+        new_low = lows[last] < prior_low
+
+    return {
+        'datetime': index[last],
+        'symbols': np.asarray(symbols),
+        'close': latest_close,
+        'gain_pct': gain_pct,
+        'gain_rank': _rank(gain_pct),
+        'gain_z': _zscore(gain_pct),
+        'volume': volume[last],
+        'volume_ratio': volume_ratio,
+        'volume_z': volume_z,
+        'new_high': new_high,
+        'new_low': new_low,
+    }
+
+def flagged(result):
+    """Mask of symbols worth a screener row this minute"""
+    valid = ~np.isnan(result['close'])
+    ranked = int(valid.sum())
+    rank = result['gain_rank']
+    return valid & ((rank <= TOP_N) | (rank > ranked - TOP_N)
+                    | (result['volume_ratio'] >= VOLUME_SPIKE)
+                    | result['new_high'] | result['new_low'])
+
+def create_table(conn):
+    """Create screener table"""
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS screener_1min (
+            datetime DATETIME NOT NULL,
+            symbol TEXT NOT NULL,
+            close REAL,
+            gain_pct REAL,
+            gain_rank INTEGER,
+            gain_z REAL,
+            volume INTEGER,
+            volume_ratio REAL,
+            volume_z REAL,
+            new_high INTEGER,
+            new_low INTEGER,
+            PRIMARY KEY (datetime, symbol)
+        )
+    ''')
+
+def load_trailing_volume(conn, symbols, since):
+    """Average minute volume per symbol from stored candles (one query)"""
+    averages = dict(conn.execute('''
+        SELECT symbol, AVG(volume) FROM stock_1min_data
+        WHERE datetime >= ? GROUP BY symbol
+    ''', (since,)).fetchall())
+    return np.array([averages.get(s, np.nan) for s in symbols], dtype='float64')
+
+def _clean(value):
+    """NumPy scalar -> SQLite friendly value"""
+    value = value.item() if hasattr(value, 'item') else value
+    return None if isinstance(value, float) and np.isnan(value) else value
+
+def store(conn, result):
+    """Write flagged rows for the minute; returns row count - caller commits"""
+    create_table(conn)
+    mask = flagged(result)
+    stamp = result['datetime'].strftime('%Y-%m-%d %H:%M:%S')
+    columns = ['close', 'gain_pct', 'gain_rank', 'gain_z', 'volume', 'volume_ratio',
+               'volume_z', 'new_high', 'new_low']
+    arrays = [result[c][mask] for c in columns]
+    rows = [
+        (stamp, symbol) + tuple(_clean(v) for v in values)
+        for symbol, *values in zip(result['symbols'][mask], *arrays)
+    ]
+    conn.executemany('''
+        INSERT OR REPLACE INTO screener_1min
+        (datetime, symbol, close, gain_pct, gain_rank, gain_z, volume,
+         volume_ratio, volume_z, new_high, new_low)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ''', rows)
+    return len(rows)
+
+def readme_section(result):
+    """Markdown/HTML block for the README snapshot"""
+    valid = ~np.isnan(result['close'])
+    symbols = result['symbols']
+
+    def table(mask, key, reverse=True, limit=TOP_N):
+        picked = np.flatnonzero(mask & valid & ~np.isnan(result[key]))
+        picked = picked[np.argsort(result[key][picked])]
+        if reverse:
+            picked = picked[::-1]
+        return tabulate(
+            [[symbols[i], f"{result['close'][i]:.2f}", f"{result['gain_pct'][i]:+.2f}%",
+              f"{result['volume_ratio'][i]:.1f}x"] for i in picked[:limit]],
+            headers=['Symbol', 'Close', 'Change', 'Vol/Avg'], tablefmt='html', disable_numparse=True
+        )
+
+    everyone = np.ones(len(symbols), dtype=bool)
+    spikes = np.nan_to_num(result['volume_ratio']) >= VOLUME_SPIKE
+    return '\n\n'.join([
+        README_MARKERS[0],
+        f"## 🔎 Screener ({result['datetime']:%Y-%m-%d %H:%M})",
+        f"New highs: {int(result['new_high'].sum())} · New lows: {int(result['new_low'].sum())} "
+        f"· Volume spikes (≥{VOLUME_SPIKE:g}x): {int((spikes & valid).sum())}",
+        '### Top gainers', table(everyone, 'gain_pct'),
+        '### Top losers', table(everyone, 'gain_pct', reverse=False),
+        '### Volume spikes', table(spikes, 'volume_ratio'),
+        README_MARKERS[1],
+    ])
+
+def update_readme(result, path='README.md'):
+    """Replace (or append) the screener section of the README snapshot"""
+    section = readme_section(result)
+    try:
+        with open(path, encoding='utf-8') as f:
+            text = f.read()
+    except FileNotFoundError:
+        text = ''
+
+    start, end = README_MARKERS
+    if start in text and end in text:
+        text = text[:text.index(start)] + section + text[text.index(end) + len(end):]
+    else:
+        text = text.rstrip('\n') + '\n\n' + section + '\n'
+
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(text)
+
+def run(panel, db_path, readme_path=None):
+    """Screen the latest minute of a merged panel and store the result"""
+    if panel is None:
+        return None
+
+    start_time = time.time()
+    conn = ingest.connect(db_path)
+    try:
+        trailing = None
+        if len(panel[0]) <= VOLUME_WINDOW:
+            since = (panel[0][-1] - timedelta(days=7)).strftime('%Y-%m-%d %H:%M:%S')
+            trailing = load_trailing_volume(conn, panel[1], since)
+        result = compute(panel, trailing)
+        rows = store(conn, result)
+        conn.commit()
+    finally:
+        conn.close()
+
+    if readme_path:
+        update_readme(result, readme_path)
+
+    elapsed = (time.time() - start_time) * 1000
+    logging.info(f"🔎 Screener: {rows} flagged of {len(panel[1])} stocks at {result['datetime']:%H:%M} in {elapsed:.1f} ms")
+    return result
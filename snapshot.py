@@ -0,0 +1,207 @@
+import mmap
+import os
+import struct
+import time
+import numpy as np
+import ingest
+
+"""
+Shared Latest-State Snapshot - fixed-layout binary file for local readers
+The fetcher publishes the latest bar of every symbol after each cycle;
+dashboards / alerting / notebooks memory-map the file instead of polling
+SQLite. Consistency uses a seqlock: the writer makes the sequence odd,
+copies the records in one bulk write, then makes it even again. Readers
+retry if the sequence was odd or changed while they were reading.
+
+Layout (little endian):
+    header   64 bytes   magic, version, symbol count, sequence, minute, published_ns
+    names    count x 24 bytes, NUL padded ASCII symbol (index = symbol id)
+    records  count x RECORD (open, high, low, close, volume, bar time)
+"""
+
+MAGIC = b'NSESNAP\0'
+VERSION = 1
+HEADER = struct.Struct('<8sIIQqq24x')   # magic, version, count, seq, minute, published_ns
+SEQ_OFFSET = 16
+NAME_SIZE = 24
+RECORD = np.dtype([('open', '<f8'), ('high', '<f8'), ('low', '<f8'), ('close', '<f8'),
+                   ('volume', '<i8'), ('time', '<i8')])
+
+def _names_block(symbols):
+    """Fixed-width symbol table"""
+    return b''.join(s.encode('ascii')[:NAME_SIZE].ljust(NAME_SIZE, b'\0') for s in symbols)
+
+def latest_records(panel):
+    """Last traded bar of every symbol in a screener panel -> RECORD array"""
+    index, symbols, values = panel
+    close = values[:, :, 3]
+    has_bar = ~np.isnan(close)
+    last = len(index) - 1 - np.argmax(has_bar[::-1], axis=0)
+    columns = np.arange(len(symbols))
+    bars = values[last, columns]
+    bars[:, :4] = ingest.snap_prices(bars[:, :4])
+
+    records = np.zeros(len(symbols), dtype=RECORD)
+    for j, field in enumerate(('open', 'high', 'low', 'close')):
+        records[field] = bars[:, j]
+    records['volume'] = np.nan_to_num(bars[:, 4]).astype(np.int64)
+    # as_unit: the index may be in s, us or ns depending on the source / pandas version
+    records['time'] = index.as_unit('s').asi8[last]
+    traded = has_bar.any(axis=0)
+    records['time'][~traded] = 0
+    records['close'][~traded] = np.nan
+    return records
+
+class SnapshotWriter:
+    """Owns the snapshot file; one publish() per cycle"""
+
+    def __init__(self, path):
+        self.path = path
+        self.symbols = None
+        self.mm = None
+
+    def _layout(self, symbols):
+        """(Re)create the file when the universe changes"""
+        self.close()
+        size = HEADER.size + len(symbols) * (NAME_SIZE + RECORD.itemsize)
+
+        # Build aside and rename, so readers never see a half-sized file
+        tmp = self.path + '.tmp'
+        with open(tmp, 'wb') as f:
+            f.write(HEADER.pack(MAGIC, VERSION, len(symbols), 0, 0, 0))
+            f.write(_names_block(symbols))
+            f.write(b'\0' * (size - f.tell()))
+        os.replace(tmp, self.path)
+
+        self.file = open(self.path, 'r+b')
+        self.mm = mmap.mmap(self.file.fileno(), size)
+        self.symbols = list(symbols)
+        self.records_offset = HEADER.size + len(symbols) * NAME_SIZE
+
+    def _attach(self, symbols):
+        """Map an existing file if it has the same universe; False otherwise"""
+        if not os.path.exists(self.path):
+            return False
+        size = HEADER.size + len(symbols) * (NAME_SIZE + RECORD.itemsize)
+        with open(self.path, 'rb') as f:
+            head = f.read(HEADER.size + len(symbols) * NAME_SIZE)
+        if os.path.getsize(self.path) != size or len(head) < HEADER.size:
+            return False
+        magic, version, count, _, _, _ = HEADER.unpack_from(head, 0)
+        if (magic, version, count) != (MAGIC, VERSION, len(symbols)) or head[HEADER.size:] != _names_block(symbols):
+            return False
+
+        self.file = open(self.path, 'r+b')
+        self.mm = mmap.mmap(self.file.fileno(), size)
+        self.symbols = list(symbols)
+        self.records_offset = HEADER.size + len(symbols) * NAME_SIZE
+        return True
+
+    def publish(self, symbols, records, minute):
+        """Seqlock-protected bulk write of all records"""
+        if self.symbols != list(symbols) and not self._attach(symbols):
+            self._layout(symbols)
+
+        # Odd while writing (already odd if a previous writer died mid-publish)
+        writing = struct.unpack_from('<Q', self.mm, SEQ_OFFSET)[0] | 1
+        struct.pack_into('<Q', self.mm, SEQ_OFFSET, writing)
+        self.mm[self.records_offset:] = records.astype(RECORD, copy=False).tobytes()
+        HEADER.pack_into(self.mm, 0, MAGIC, VERSION, len(symbols), writing + 1, int(minute), time.time_ns())
+        return writing + 1
+
+    def close(self):
+        if self.mm is not None:
+            self.mm.close()
+            self.file.close()
+            self.mm = None
+
+def _in_order(panel, symbols):
+    """Panel with exactly these symbols in this order (all-NaN columns for missing ones)"""
+    index, panel_symbols, values = panel
+    symbols = list(dict.fromkeys(symbols))
+    positions = {symbol: i for i, symbol in enumerate(panel_symbols)}
+    ordered = np.full((len(index), len(symbols)) + values.shape[2:], np.nan)
+    found = [(j, positions[s]) for j, s in enumerate(symbols) if s in positions]
+    if found:
+        target, source = map(list, zip(*found))
+        ordered[:, target] = values[:, source]
+    return index, symbols, ordered
+
+def publish(path, panel, symbols=None):
+    """Write the latest bar of every symbol to the snapshot file
+    symbols fixes the layout (the profile universe): the fetch order changes
+    from run to run, and any change of layout replaces the file"""
+    if panel is None:
+        return None
+    if symbols is not None:
+        panel = _in_order(panel, symbols)
+    writer = SnapshotWriter(path)
+    try:
+        records = latest_records(panel)
+        minute = int(records['time'].max())
+        return writer.publish(panel[1], records, minute)
+    finally:
+        writer.close()
+
+class SnapshotReader:
+    """Zero-copy reader - map once, read records with a sequence check"""
+
+    def __init__(self, path):
+        self.path = path
+        self._open()
+
+    def _open(self):
+        self.file = open(self.path, 'rb')
+        self.inode = os.fstat(self.file.fileno()).st_ino
+        self.mm = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, count, _, _, _ = HEADER.unpack_from(self.mm, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{self.path}: not a version {VERSION} snapshot")
+        names = np.frombuffer(self.mm, dtype=f'S{NAME_SIZE}', count=count, offset=HEADER.size)
+        self.symbols = [name.decode('ascii') for name in names]
+        self.ids = {symbol: i for i, symbol in enumerate(self.symbols)}
+        self.records = np.frombuffer(self.mm, dtype=RECORD, count=count,
+                                     offset=HEADER.size + count * NAME_SIZE)
+
+    def reopen_if_replaced(self):
+        """Pick up a new layout after the writer changed the universe"""
+        try:
+            if os.stat(self.path).st_ino != self.inode:
+                self.close()
+                self._open()
+                return True
+        except FileNotFoundError:
+            pass
+        return False
+
+    def header(self):
+        """(sequence, minute, published_ns)"""
+        _, _, _, seq, minute, published = HEADER.unpack_from(self.mm, 0)
+        return seq, minute, published
+
+    def _read(self, fetch, retries=1000):
+        """Run fetch() under the seqlock until it sees a stable, even sequence"""
+        # A relayout leaves the old file frozen - follow the writer to the new one first
+        self.reopen_if_replaced()
+        for _ in range(retries):
+            before = struct.unpack_from('<Q', self.mm, SEQ_OFFSET)[0]
+            if before & 1:
+                time.sleep(0)
+                continue
+            value = fetch()
+            if struct.unpack_from('<Q', self.mm, SEQ_OFFSET)[0] == before:
+                return before, value
+        raise TimeoutError(f"{self.path}: writer did not finish")
+
+    def get(self, symbol):
+        """(sequence, record) for one symbol"""
+        return self._read(lambda: self.records[self.ids[symbol]].copy())
+
+    def latest(self):
+        """(sequence, copy of all records)"""
+        return self._read(lambda: self.records.copy())
+
+    def close(self):
+        self.records = None
+        self.mm.close()
+        self.file.close()